@@ -3,13 +3,49 @@ Whisper Fedora - Article Generator Module
 Multi-format article generation from processed transcriptions using LM Studio
 """
 
+import os
+import re
 import json
+import time
+import asyncio
+import hashlib
+import threading
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass, field
 from typing import Optional, Callable
 from enum import Enum
 
 from text_processor import LMStudioClient, DEFAULT_LM_STUDIO_URL
 
+try:
+    # Optional: faster JSON parser that also accepts truncated model output
+    from pydantic_core import from_json as _from_json
+except ImportError:
+    _from_json = None
+
+try:
+    # Optional: full single-pass markdown renderer for HTML export
+    import mistune
+except ImportError:
+    mistune = None
+
+
+# Parallel format requests sent to LM Studio at once
+# (keep <= "Max Concurrent Predictions" in LM Studio server settings)
+DEFAULT_MAX_CONCURRENCY = 5
+
+# Source text limits (characters) per prompt type
+TOPIC_TEXT_LIMIT = 15000
+ARTICLE_TEXT_LIMIT = 12000
+
+# Response cache: most recent responses kept in memory and on disk (least
+# recently used first out), and how long the loaded-model id used in cache
+# keys is trusted
+MAX_MEMORY_CACHE_ENTRIES = 128
+MAX_DISK_CACHE_ENTRIES = 1000
+CACHE_MODEL_TTL = 10.0  # seconds
+
 
 # ============================================================================
 # ARTICLE FORMATS
@@ -53,44 +89,78 @@ ARTICLE_FORMAT_INFO = {
     }
 }
 
+# Short "icon + first word" labels for tabs and combo boxes, built once
+ARTICLE_FORMAT_DISPLAY = {
+    fmt: f"{info['icon']} {info['name'].split()[1]}"
+    for fmt, info in ARTICLE_FORMAT_INFO.items()
+}
+
 
 # ============================================================================
 # DATA CLASSES
 # ============================================================================
 
-@dataclass
+_WORD_RE = re.compile(r'\S+')
+
+
+@dataclass(slots=True, frozen=True)
 class TopicAnalysis:
-    """Extracted topics from text."""
-    main_topics: list[str] = field(default_factory=list)
-    key_insights: list[str] = field(default_factory=list)
-    notable_quotes: list[str] = field(default_factory=list)
-    suggested_titles: list[str] = field(default_factory=list)
+    """Extracted topics from text (immutable and hashable)."""
+    main_topics: tuple[str, ...] = ()
+    key_insights: tuple[str, ...] = ()
+    notable_quotes: tuple[str, ...] = ()
+    suggested_titles: tuple[str, ...] = ()
+    
+    def __post_init__(self):
+        # Accept loosely-shaped JSON values and store tuples: a list becomes
+        # a tuple, a lone string a 1-tuple, null or anything else empty
+        for name in self.__dataclass_fields__:
+            value = getattr(self, name)
+            if isinstance(value, tuple):
+                continue
+            if isinstance(value, list):
+                value = tuple(value)
+            elif isinstance(value, str):
+                value = (value,)
+            else:
+                value = ()
+            object.__setattr__(self, name, value)
+    
+    # Serialized key -> field name, shared by to_dict() and to_json()
+    _SERIALIZED_FIELDS = (
+        ("topics", "main_topics"),
+        ("insights", "key_insights"),
+        ("quotes", "notable_quotes"),
+        ("titles", "suggested_titles"),
+    )
     
     def to_dict(self) -> dict:
-        return {
-            "topics": self.main_topics,
-            "insights": self.key_insights,
-            "quotes": self.notable_quotes,
-            "titles": self.suggested_titles
-        }
+        return {key: list(getattr(self, name)) for key, name in self._SERIALIZED_FIELDS}
+    
+    def to_json(self) -> str:
+        """Serialize to the same JSON shape the topic prompt produces."""
+        return json.dumps(self.to_dict(), ensure_ascii=False)
 
 
-@dataclass
+@dataclass(slots=True)
 class Article:
     """Generated article content."""
     title: str
     format: ArticleFormat
     content: str
     topics: list[str] = field(default_factory=list)
-    word_count: int = 0
+    word_count: Optional[int] = None  # Computed from content when not given
     quality_score: float = 0.0
     
     def __post_init__(self):
-        if self.word_count == 0:
-            self.word_count = len(self.content.split())
+        # None means "not computed yet"; a restored or replace()'d article
+        # keeps its count, including a genuine 0
+        if self.word_count is None:
+            # Count matches without materializing a list of every word
+            self.word_count = sum(1 for _ in _WORD_RE.finditer(self.content))
 
 
-@dataclass
+@dataclass(slots=True)
 class GenerationResult:
     """Result of article generation."""
     source_text: str
@@ -103,12 +173,17 @@ class GenerationResult:
 # PROMPTS
 # ============================================================================
 
-TOPIC_EXTRACTION_PROMPT = """Analyze this transcription and extract key information.
+# Prompts keep static instructions strictly first and per-call data
+# (topics, transcript) strictly last, so LM Studio's prompt cache can reuse
+# the instruction prefix instead of re-prefilling it on every request.
+
+# Shared system message for every article request (identical cached prefix)
+ARTICLE_SYSTEM_PROMPT = """You are a content writer turning spoken transcriptions into written content.
+Use only information present in the source content.
+Follow the requested output format exactly, with no meta-commentary."""
 
-Transcription:
----
-{text}
----
+
+TOPIC_EXTRACTION_PROMPT = """Analyze the transcription below and extract key information.
 
 Respond ONLY with valid JSON in this exact format:
 {{
@@ -118,18 +193,14 @@ Respond ONLY with valid JSON in this exact format:
   "titles": ["suggested title 1", "suggested title 2"]
 }}
 
-Extract 3-7 main topics, 2-5 key insights, 2-4 notable quotes, and 2-3 suggested article titles."""
+Extract 3-7 main topics, 2-5 key insights, 2-4 notable quotes, and 2-3 suggested article titles.
 
+---
+Transcription:
+{text}"""
 
-BLOG_POST_PROMPT = """Write a blog post based on this content and topics.
 
-Topics: {topics}
-Key Insights: {insights}
-
-Source Content:
----
-{text}
----
+BLOG_POST_PROMPT = """Write a blog post based on the source content and topics below.
 
 Create a well-structured blog post with:
 1. An engaging title (format: # Title)
@@ -139,15 +210,18 @@ Create a well-structured blog post with:
 5. Brief conclusion
 
 Write in a conversational but professional style. Use markdown formatting.
-Output ONLY the blog post, no meta-commentary."""
-
+Output ONLY the blog post, no meta-commentary.
 
-FAQ_PROMPT = """Create an FAQ article from this content.
+---
+Topics: {topics}
+Key Insights:
+{insights}
 
 Source Content:
----
-{text}
----
+{text}"""
+
+
+FAQ_PROMPT = """Create an FAQ article from the source content below.
 
 Generate 5-8 frequently asked questions with detailed answers based on the content.
 Use this format:
@@ -162,17 +236,14 @@ Use this format:
 
 ...continue for all questions
 
-Extract real questions and answers from the content. Do NOT invent information."""
+Extract real questions and answers from the content. Do NOT invent information.
 
+---
+Source Content:
+{text}"""
 
-LISTICLE_PROMPT = """Create a listicle article from this content.
 
-Topics: {topics}
-
-Source Content:
----
-{text}
----
+LISTICLE_PROMPT = """Create a listicle article from the source content and topics below.
 
 Create a numbered list article with 5-10 key points.
 Format:
@@ -187,15 +258,16 @@ Format:
 
 ...continue for all points
 
-Each point should be actionable and insightful. Use markdown formatting."""
-
+Each point should be actionable and insightful. Use markdown formatting.
 
-SUMMARY_PROMPT = """Write an executive summary of this content.
+---
+Topics: {topics}
 
 Source Content:
----
-{text}
----
+{text}"""
+
+
+SUMMARY_PROMPT = """Write an executive summary of the source content below.
 
 Create a brief summary with:
 - 1 paragraph overview (what this is about)
@@ -203,18 +275,14 @@ Create a brief summary with:
 - 1 paragraph conclusion/recommendation
 
 Keep it under 300 words. Be concise but comprehensive.
-Format with markdown (use **bold** for emphasis)."""
+Format with markdown (use **bold** for emphasis).
 
+---
+Source Content:
+{text}"""
 
-SOCIAL_PROMPT = """Create social media snippets from this content.
 
-Key Insights: {insights}
-Notable Quotes: {quotes}
-
-Source Content:
----
-{text}
----
+SOCIAL_PROMPT = """Create social media snippets from the source content below.
 
 Generate 5 short social media posts:
 - Each must be under 280 characters
@@ -225,15 +293,19 @@ Generate 5 short social media posts:
 Format as a numbered list:
 1. [first post]
 2. [second post]
-...etc"""
+...etc
+
+---
+Key Insights:
+{insights}
+Notable Quotes:
+{quotes}
 
+Source Content:
+{text}"""
 
-QUALITY_SCORING_PROMPT = """Rate this article on a scale of 1-10 for each criterion:
 
-Article:
----
-{article}
----
+QUALITY_SCORING_PROMPT = """Rate the article below on a scale of 1-10 for each criterion.
 
 Rate (respond with JSON only):
 {{
@@ -242,23 +314,287 @@ Rate (respond with JSON only):
   "engagement": [1-10 score],
   "accuracy": [1-10 score],
   "overall": [1-10 average score]
-}}"""
+}}
+
+---
+Article:
+{article}"""
+
+
+COMBINED_PROMPT = """Analyze the transcription below and write content from it in several formats.
+
+Respond ONLY with valid JSON containing exactly these keys:
+  "topics": list of 3-7 main topics
+  "insights": list of 2-5 key insights
+  "quotes": list of 2-4 notable quotes
+  "titles": list of 2-3 suggested article titles
+{format_keys}
+
+Each article value is a markdown string that starts with a "# Title" heading.
+Escape newlines and quotes so the JSON stays valid.
+
+---
+Transcription:
+{text}"""
 
 
 # ============================================================================
 # ARTICLE GENERATOR
 # ============================================================================
 
+_JSON_FENCE_RE = re.compile(r'```(?:json)?\s*(\{.*?\})\s*```', re.DOTALL)
+
+
+def _extract_json(text: str) -> str:
+    """Extract the JSON object from an LLM response (code fence or bare)."""
+    match = _JSON_FENCE_RE.search(text)
+    if match:
+        return match.group(1)
+    # Skip prose around the object; keep an unterminated tail for partial parsing
+    start = max(text.find('{'), 0)
+    end = text.rfind('}')
+    return text[start:end + 1] if end > start else text[start:]
+
+
+# Shared client so generators created per request reuse keep-alive connections
+_default_client: Optional[LMStudioClient] = None
+
+
+def _get_default_client() -> LMStudioClient:
+    """Get the process-wide LM Studio client (lazy created)."""
+    global _default_client
+    if _default_client is None:
+        _default_client = LMStudioClient()
+    return _default_client
+
+
+def _loads(text: str):
+    """Parse JSON, tolerating unterminated output when pydantic_core is available."""
+    if _from_json is not None:
+        return _from_json(text, allow_partial=True)
+    return json.loads(text)
+
+
 class ArticleGenerator:
     """Generate articles in multiple formats from transcribed text."""
     
-    def __init__(self, lm_client: Optional[LMStudioClient] = None):
-        self.lm_client = lm_client or LMStudioClient()
+    def __init__(
+        self,
+        lm_client: Optional[LMStudioClient] = None,
+        max_concurrency: int = DEFAULT_MAX_CONCURRENCY,
+        cache_dir: Optional[str] = None,
+        single_request: bool = False
+    ):
+        self.lm_client = lm_client or _get_default_client()
+        self.max_concurrency = max(1, max_concurrency)
+        
+        # Generate topics and every format in one combined LLM request
+        # (see generate_all_formats_combined) instead of N+1 requests
+        self.single_request = single_request
+        
+        # Optional exact-match response cache (disabled by default so
+        # regenerating an article still produces a fresh variant)
+        self.cache_dir = cache_dir
+        self._cache: OrderedDict[str, str] = OrderedDict()  # LRU, most recent last
+        self._cache_lock = threading.Lock()
+        self._cache_model: Optional[str] = None
+        self._cache_model_checked = 0.0
+        if cache_dir:
+            os.makedirs(cache_dir, exist_ok=True)
     
     def is_available(self) -> bool:
         """Check if LM Studio is available."""
         return self.lm_client.check_connection()
     
+    def _cache_key(
+        self,
+        prompt: str,
+        system_prompt: Optional[str],
+        temperature: float,
+        max_tokens: int
+    ) -> str:
+        """Hash of everything that determines the response for a prompt."""
+        model = self._loaded_model()
+        raw = f"{self.lm_client.base_url}|{model}|{system_prompt}|{prompt}|{temperature}|{max_tokens}"
+        return hashlib.blake2b(raw.encode('utf-8'), digest_size=16).hexdigest()
+    
+    def _loaded_model(self) -> Optional[str]:
+        """Model loaded in LM Studio, re-queried at most every CACHE_MODEL_TTL seconds."""
+        now = time.monotonic()
+        with self._cache_lock:
+            if now - self._cache_model_checked < CACHE_MODEL_TTL:
+                return self._cache_model
+        
+        model = self.lm_client.get_loaded_model()
+        with self._cache_lock:
+            self._cache_model = model
+            self._cache_model_checked = now
+        return model
+    
+    def _cached_chat(
+        self,
+        prompt: str,
+        temperature: float,
+        max_tokens: int,
+        system_prompt: Optional[str] = ARTICLE_SYSTEM_PROMPT,
+        on_chunk: Optional[Callable[[str], None]] = None
+    ) -> Optional[str]:
+        """
+        Chat completion through the exact-match response cache.
+        
+        Falls through to LM Studio directly when no cache_dir is configured.
+        Failed requests (None) are never cached. When on_chunk is given the
+        response is streamed and each content chunk is passed to it.
+        """
+        if not self.cache_dir:
+            return self._chat(prompt, temperature, max_tokens, system_prompt, on_chunk)
+        
+        key = self._cache_key(prompt, system_prompt, temperature, max_tokens)
+        response = self._cache_get(key)
+        if response is not None:
+            return response
+        
+        response = self._chat(prompt, temperature, max_tokens, system_prompt, on_chunk)
+        if response:
+            self._cache_put(key, response)
+        
+        return response
+    
+    async def _acached_chat(
+        self,
+        prompt: str,
+        temperature: float,
+        max_tokens: int,
+        system_prompt: Optional[str] = ARTICLE_SYSTEM_PROMPT,
+        session=None
+    ) -> Optional[str]:
+        """
+        Async variant of _cached_chat (no streaming).
+        
+        The cache key needs the loaded model (an HTTP request) and the cache
+        lives on disk, so both run in a worker thread to keep the loop free.
+        """
+        key = None
+        if self.cache_dir:
+            key, response = await asyncio.to_thread(
+                self._cache_lookup, prompt, system_prompt, temperature, max_tokens
+            )
+            if response is not None:
+                return response
+        
+        response = await self.lm_client.achat_completion(
+            prompt=prompt,
+            system_prompt=system_prompt,
+            temperature=temperature,
+            max_tokens=max_tokens,
+            session=session
+        )
+        if key and response:
+            await asyncio.to_thread(self._cache_put, key, response)
+        
+        return response
+    
+    def _cache_lookup(
+        self,
+        prompt: str,
+        system_prompt: Optional[str],
+        temperature: float,
+        max_tokens: int
+    ) -> tuple[str, Optional[str]]:
+        """Cache key for a request and its cached response, if any."""
+        key = self._cache_key(prompt, system_prompt, temperature, max_tokens)
+        return key, self._cache_get(key)
+    
+    def _cache_get(self, key: str) -> Optional[str]:
+        """Look up a cached response in memory, then on disk."""
+        with self._cache_lock:
+            if key in self._cache:
+                self._cache.move_to_end(key)
+                return self._cache[key]
+        
+        path = os.path.join(self.cache_dir, f"{key}.txt")
+        try:
+            with open(path, 'r', encoding='utf-8') as f:
+                response = f.read()
+            os.utime(path)  # mtime is the disk cache's LRU order
+        except OSError:
+            return None
+        
+        self._remember(key, response)
+        return response
+    
+    def _remember(self, key: str, response: str) -> None:
+        """Add a response to the in-memory LRU, evicting the oldest past the cap."""
+        with self._cache_lock:
+            self._cache[key] = response
+            self._cache.move_to_end(key)
+            while len(self._cache) > MAX_MEMORY_CACHE_ENTRIES:
+                self._cache.popitem(last=False)
+    
+    def _cache_put(self, key: str, response: str) -> None:
+        """Store a response in memory and on disk."""
+        self._remember(key, response)
+        try:
+            with open(os.path.join(self.cache_dir, f"{key}.txt"), 'w', encoding='utf-8') as f:
+                f.write(response)
+        except OSError:
+            return  # Cache is best-effort
+        self._prune_disk_cache()
+    
+    def _prune_disk_cache(self) -> None:
+        """Delete the least recently used cache files beyond MAX_DISK_CACHE_ENTRIES."""
+        try:
+            with os.scandir(self.cache_dir) as entries:
+                files = [
+                    (entry.stat().st_mtime_ns, entry.path)
+                    for entry in entries
+                    if entry.name.endswith('.txt') and entry.is_file()
+                ]
+        except OSError:
+            return
+        
+        if len(files) <= MAX_DISK_CACHE_ENTRIES:
+            return
+        files.sort()
+        for _, path in files[:len(files) - MAX_DISK_CACHE_ENTRIES]:
+            try:
+                os.remove(path)
+            except OSError:
+                pass  # Already pruned by another thread
+    
+    def _chat(
+        self,
+        prompt: str,
+        temperature: float,
+        max_tokens: int,
+        system_prompt: Optional[str],
+        on_chunk: Optional[Callable[[str], None]] = None
+    ) -> Optional[str]:
+        """Send a request to LM Studio, streaming it when on_chunk is set."""
+        if on_chunk is None:
+            return self.lm_client.chat_completion(
+                prompt=prompt,
+                system_prompt=system_prompt,
+                temperature=temperature,
+                max_tokens=max_tokens
+            )
+        
+        chunks = []
+        try:
+            for chunk in self.lm_client.chat_completion_stream(
+                prompt=prompt,
+                system_prompt=system_prompt,
+                temperature=temperature,
+                max_tokens=max_tokens
+            ):
+                chunks.append(chunk)
+                on_chunk(chunk)
+        except Exception:
+            # Same contract as chat_completion: failed requests return None
+            return None
+        
+        return "".join(chunks) or None
+    
     def extract_topics(
         self,
         text: str,
@@ -278,10 +614,10 @@ class ArticleGenerator:
             on_progress(10, "Extracting topics...")
         
         # Truncate if too long for single prompt
-        analysis_text = text[:15000] if len(text) > 15000 else text
+        analysis_text = text[:TOPIC_TEXT_LIMIT]
         
         prompt = TOPIC_EXTRACTION_PROMPT.format(text=analysis_text)
-        response = self.lm_client.chat_completion(
+        response = self._cached_chat(
             prompt=prompt,
             temperature=0.5,
             max_tokens=1024
@@ -290,23 +626,20 @@ class ArticleGenerator:
         if on_progress:
             on_progress(30, "Parsing topic analysis...")
         
+        return self._parse_topics(response)
+    
+    def _parse_topics(self, response: Optional[str]) -> TopicAnalysis:
+        """Build TopicAnalysis from a topic extraction response."""
         if response:
             try:
-                # Clean up response - handle markdown code blocks
-                clean_response = response.strip()
-                if clean_response.startswith("```"):
-                    clean_response = clean_response.split("```")[1]
-                    if clean_response.startswith("json"):
-                        clean_response = clean_response[4:]
-                
-                data = json.loads(clean_response)
+                data = _loads(_extract_json(response)) or {}
                 return TopicAnalysis(
                     main_topics=data.get("topics", []),
                     key_insights=data.get("insights", []),
                     notable_quotes=data.get("quotes", []),
                     suggested_titles=data.get("titles", [])
                 )
-            except json.JSONDecodeError:
+            except (ValueError, AttributeError):
                 # Return basic analysis if parsing fails
                 pass
         
@@ -322,7 +655,8 @@ class ArticleGenerator:
         text: str,
         format: ArticleFormat,
         topics: Optional[TopicAnalysis] = None,
-        on_progress: Optional[Callable[[int, str], None]] = None
+        on_progress: Optional[Callable[[int, str], None]] = None,
+        analysis_text: Optional[str] = None
     ) -> Article:
         """
         Generate a single article in the specified format.
@@ -332,6 +666,7 @@ class ArticleGenerator:
             format: Article format to generate
             topics: Pre-extracted topics (optional, will extract if not provided)
             on_progress: Progress callback
+            analysis_text: Pre-truncated source text (optional, shared across formats)
             
         Returns:
             Generated Article
@@ -344,42 +679,71 @@ class ArticleGenerator:
             topics = self.extract_topics(text, on_progress)
         
         # Select prompt based on format
-        prompt = self._get_format_prompt(text, format, topics)
+        prompt = self._get_format_prompt(text, format, topics, analysis_text)
         
         if on_progress:
             on_progress(40, f"Writing {format.value} content...")
         
-        response = self.lm_client.chat_completion(
+        # Stream so the title can be reported as soon as the first line lands
+        on_chunk = None
+        if on_progress:
+            head_chunks = []
+            title_checked = False
+            
+            def on_chunk(chunk: str):
+                nonlocal title_checked
+                if title_checked:
+                    return
+                head_chunks.append(chunk)
+                head = "".join(head_chunks).lstrip()
+                if '\n' in head:
+                    title_checked = True
+                    first_line = head.split('\n', 1)[0].strip()
+                    if first_line.startswith('# '):
+                        on_progress(50, f"Writing: {first_line[2:].strip()}")
+        
+        response = self._cached_chat(
             prompt=prompt,
             temperature=0.7,
-            max_tokens=4096
+            max_tokens=4096,
+            on_chunk=on_chunk
         )
         
+        if not response:
+            return self._build_article(None, format, topics)
+        
+        if on_progress:
+            on_progress(90, "Finalizing article...")
+        
+        article = self._build_article(response, format, topics)
+        
+        if on_progress:
+            on_progress(100, "Article complete")
+        
+        return article
+    
+    def _build_article(
+        self,
+        response: Optional[str],
+        format: ArticleFormat,
+        topics: TopicAnalysis
+    ) -> Article:
+        """Wrap a generation response in an Article (placeholder on failure)."""
         if not response:
             return Article(
                 title="Generation Failed",
                 format=format,
                 content="Unable to generate article. Please check LM Studio connection.",
-                topics=topics.main_topics
+                topics=list(topics.main_topics)
             )
         
         # Extract title from content (first # heading)
-        title = self._extract_title(response, topics)
-        
-        if on_progress:
-            on_progress(90, "Finalizing article...")
-        
-        article = Article(
-            title=title,
+        return Article(
+            title=self._extract_title(response, topics),
             format=format,
             content=response,
-            topics=topics.main_topics
+            topics=list(topics.main_topics)
         )
-        
-        if on_progress:
-            on_progress(100, "Article complete")
-        
-        return article
     
     def generate_all_formats(
         self,
@@ -390,6 +754,9 @@ class ArticleGenerator:
         """
         Generate articles in multiple formats.
         
+        Uses one combined request when the generator was created with
+        single_request=True.
+        
         Args:
             text: Source text
             formats: List of formats to generate (default: all)
@@ -398,7 +765,9 @@ class ArticleGenerator:
         Returns:
             GenerationResult with all generated articles
         """
-        import time
+        if self.single_request:
+            return self.generate_all_formats_combined(text, formats, on_progress)
+        
         start_time = time.time()
         
         if formats is None:
@@ -407,22 +776,119 @@ class ArticleGenerator:
         if on_progress:
             on_progress(0, "Starting article generation...")
         
+        # Truncate once for all prompts (slicing an already short string is free)
+        topic_text = text[:TOPIC_TEXT_LIMIT]
+        analysis_text = topic_text[:ARTICLE_TEXT_LIMIT]
+        
         # Extract topics once for all articles
-        topics = self.extract_topics(text, on_progress)
+        topics = self.extract_topics(topic_text, on_progress)
         
-        articles = []
         total_formats = len(formats)
         
-        for i, fmt in enumerate(formats):
-            base_progress = 30 + int(60 * i / total_formats)
-            
+        # Formats are independent once topics are known, so requests run
+        # concurrently; progress is reported as the average across formats
+        progress_lock = threading.Lock()
+        format_pcts = [0] * total_formats
+        
+        def make_progress(index):
             def format_progress(pct, msg):
-                if on_progress:
-                    actual = base_progress + int(pct * 0.6 / total_formats)
+                with progress_lock:
+                    format_pcts[index] = pct
+                    actual = 30 + int(0.6 * sum(format_pcts) / total_formats)
                     on_progress(actual, msg)
+            return format_progress
+        
+        workers = min(self.max_concurrency, total_formats) or 1
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            futures = [
+                executor.submit(
+                    self.generate_article, text, fmt, topics,
+                    # Without a callback, skip streaming (it only feeds progress)
+                    make_progress(i) if on_progress else None, analysis_text
+                )
+                for i, fmt in enumerate(formats)
+            ]
+            articles = [future.result() for future in futures]
+        
+        generation_time = time.time() - start_time
+        
+        if on_progress:
+            on_progress(100, f"Generated {len(articles)} articles in {generation_time:.1f}s")
+        
+        return GenerationResult(
+            source_text=text,
+            topic_analysis=topics,
+            articles=articles,
+            generation_time=generation_time
+        )
+    
+    def generate_all_formats_combined(
+        self,
+        text: str,
+        formats: Optional[list[ArticleFormat]] = None,
+        on_progress: Optional[Callable[[int, str], None]] = None
+    ) -> GenerationResult:
+        """
+        Generate topics and all formats with a single LLM request.
+        
+        The transcript is sent (and prefilled) once instead of once per
+        format, which suits rate-limited servers and long transcripts.
+        Partial JSON responses still yield whatever formats completed.
+        
+        Args:
+            text: Source text
+            formats: List of formats to generate (default: all)
+            on_progress: Progress callback
             
-            article = self.generate_article(text, fmt, topics, format_progress)
-            articles.append(article)
+        Returns:
+            GenerationResult with all generated articles
+        """
+        start_time = time.time()
+        
+        if formats is None:
+            formats = list(ArticleFormat)
+        
+        if on_progress:
+            on_progress(0, "Starting combined article generation...")
+        
+        analysis_text = text[:TOPIC_TEXT_LIMIT]
+        
+        format_keys = "\n".join(
+            f'  "{fmt.value}_md": {ARTICLE_FORMAT_INFO[fmt]["description"].lower()}'
+            for fmt in formats
+        )
+        prompt = COMBINED_PROMPT.format(format_keys=format_keys, text=analysis_text)
+        
+        if on_progress:
+            on_progress(10, f"Writing {len(formats)} formats in one request...")
+        
+        response = self._cached_chat(
+            prompt=prompt,
+            temperature=0.7,
+            max_tokens=8192
+        )
+        
+        if on_progress:
+            on_progress(90, "Parsing combined response...")
+        
+        data = {}
+        if response:
+            try:
+                parsed = _loads(_extract_json(response))
+                if isinstance(parsed, dict):
+                    data = parsed
+            except ValueError:
+                pass
+        
+        # Without topics the response is unusable for analysis: take the fallback
+        topics = self._parse_topics(response if data.get("topics") else None)
+        
+        articles = []
+        for fmt in formats:
+            content = data.get(f"{fmt.value}_md")
+            if not isinstance(content, str) or not content.strip():
+                content = None
+            articles.append(self._build_article(content, fmt, topics))
         
         generation_time = time.time() - start_time
         
@@ -436,6 +902,116 @@ class ArticleGenerator:
             generation_time=generation_time
         )
     
+    async def aextract_topics(self, text: str, session=None) -> TopicAnalysis:
+        """Async variant of extract_topics."""
+        analysis_text = text[:TOPIC_TEXT_LIMIT]
+        
+        prompt = TOPIC_EXTRACTION_PROMPT.format(text=analysis_text)
+        response = await self._acached_chat(
+            prompt=prompt,
+            temperature=0.5,
+            max_tokens=1024,
+            session=session
+        )
+        
+        return self._parse_topics(response)
+    
+    async def agenerate_article(
+        self,
+        text: str,
+        format: ArticleFormat,
+        topics: Optional[TopicAnalysis] = None,
+        analysis_text: Optional[str] = None,
+        session=None
+    ) -> Article:
+        """Async variant of generate_article."""
+        if topics is None:
+            topics = await self.aextract_topics(text, session)
+        
+        prompt = self._get_format_prompt(text, format, topics, analysis_text)
+        response = await self._acached_chat(
+            prompt=prompt,
+            temperature=0.7,
+            max_tokens=4096,
+            session=session
+        )
+        
+        return self._build_article(response, format, topics)
+    
+    async def agenerate_all_formats(
+        self,
+        text: str,
+        formats: Optional[list[ArticleFormat]] = None,
+        on_progress: Optional[Callable[[int, str], None]] = None
+    ) -> GenerationResult:
+        """
+        Async variant of generate_all_formats for use inside an event loop.
+        
+        All format requests share one event loop instead of a thread each;
+        at most max_concurrency requests are in flight at once.
+        
+        Args:
+            text: Source text
+            formats: List of formats to generate (default: all)
+            on_progress: Progress callback
+            
+        Returns:
+            GenerationResult with all generated articles
+        """
+        start_time = time.time()
+        
+        if formats is None:
+            formats = list(ArticleFormat)
+        
+        if on_progress:
+            on_progress(10, "Extracting topics...")
+        
+        topic_text = text[:TOPIC_TEXT_LIMIT]
+        analysis_text = topic_text[:ARTICLE_TEXT_LIMIT]
+        
+        if self.cache_dir:
+            # Resolve the model for cache keys once, before requests fan out
+            await asyncio.to_thread(self._loaded_model)
+        
+        # One HTTP session for the whole run so requests share connections
+        session = self.lm_client.async_session()
+        try:
+            topics = await self.aextract_topics(topic_text, session)
+            
+            if on_progress:
+                on_progress(30, f"Writing {len(formats)} formats...")
+            
+            semaphore = asyncio.Semaphore(self.max_concurrency)
+            completed = 0
+            
+            async def generate(fmt: ArticleFormat) -> Article:
+                nonlocal completed
+                async with semaphore:
+                    article = await self.agenerate_article(
+                        text, fmt, topics, analysis_text, session
+                    )
+                completed += 1
+                if on_progress:
+                    on_progress(30 + int(60 * completed / len(formats)), f"Finished {fmt.value}")
+                return article
+            
+            articles = await asyncio.gather(*(generate(fmt) for fmt in formats))
+        finally:
+            if session is not None:
+                await session.close()
+        
+        generation_time = time.time() - start_time
+        
+        if on_progress:
+            on_progress(100, f"Generated {len(articles)} articles in {generation_time:.1f}s")
+        
+        return GenerationResult(
+            source_text=text,
+            topic_analysis=topics,
+            articles=list(articles),
+            generation_time=generation_time
+        )
+    
     def score_quality(self, article: Article) -> float:
         """
         Score article quality using LLM.
@@ -447,7 +1023,7 @@ class ArticleGenerator:
             Quality score (0-10)
         """
         prompt = QUALITY_SCORING_PROMPT.format(article=article.content[:3000])
-        response = self.lm_client.chat_completion(
+        response = self._cached_chat(
             prompt=prompt,
             temperature=0.3,
             max_tokens=256
@@ -455,17 +1031,11 @@ class ArticleGenerator:
         
         if response:
             try:
-                clean_response = response.strip()
-                if clean_response.startswith("```"):
-                    clean_response = clean_response.split("```")[1]
-                    if clean_response.startswith("json"):
-                        clean_response = clean_response[4:]
-                
-                data = json.loads(clean_response)
+                data = _loads(_extract_json(response)) or {}
                 score = data.get("overall", 5.0)
                 article.quality_score = float(score)
                 return float(score)
-            except (json.JSONDecodeError, ValueError):
+            except (ValueError, TypeError, AttributeError):
                 pass
         
         return 5.0  # Default middle score
@@ -474,13 +1044,14 @@ class ArticleGenerator:
         self,
         text: str,
         format: ArticleFormat,
-        topics: TopicAnalysis
+        topics: TopicAnalysis,
+        analysis_text: Optional[str] = None
     ) -> str:
         """Get the appropriate prompt for the format."""
         
-        # Truncate text if too long
-        max_text_len = 12000
-        analysis_text = text[:max_text_len] if len(text) > max_text_len else text
+        # Truncate text if too long (callers may pass a pre-truncated slice)
+        if analysis_text is None:
+            analysis_text = text[:ARTICLE_TEXT_LIMIT]
         
         if format == ArticleFormat.BLOG_POST:
             return BLOG_POST_PROMPT.format(
@@ -512,9 +1083,11 @@ class ArticleGenerator:
     
     def _extract_title(self, content: str, topics: TopicAnalysis) -> str:
         """Extract or generate title from content."""
-        lines = content.strip().split('\n')
+        # Only the first 5 lines can hold the title; don't split the whole article
+        head = content.lstrip()[:512]
+        lines = head.split('\n', 5)[:5]
         
-        for line in lines[:5]:  # Check first 5 lines
+        for line in lines:
             line = line.strip()
             if line.startswith('# ') and not line.startswith('## '):
                 return line[2:].strip()
@@ -532,27 +1105,42 @@ class ArticleGenerator:
 # EXPORT FUNCTIONS
 # ============================================================================
 
+# Markdown patterns for HTML export, compiled once at import
+_HEADING_RE = re.compile(r'^(#{1,3}) (.+)$', re.MULTILINE)
+_BOLD_RE = re.compile(r'\*\*(.+?)\*\*')
+_ITALIC_RE = re.compile(r'\*(.+?)\*')
+
+# Anything but letters, digits, space, '-' and '_' is replaced in filenames
+_UNSAFE_FILENAME_RE = re.compile(r'[^\w \-]')
+
+
+def safe_filename(title: str, max_length: int = 50) -> str:
+    """Turn an article title into a filesystem-safe file name stem."""
+    return _UNSAFE_FILENAME_RE.sub('_', title)[:max_length].strip()
+
+
+def _heading_to_html(match: re.Match) -> str:
+    level = len(match.group(1))
+    return f'<h{level}>{match.group(2)}</h{level}>'
+
+
 def export_article_md(article: Article, filepath: str) -> None:
     """Export article as Markdown file."""
-    with open(filepath, 'w', encoding='utf-8') as f:
-        f.write(article.content)
+    # Encode once and write bytes, skipping the TextIOWrapper layer
+    with open(filepath, 'wb') as f:
+        f.write(article.content.encode('utf-8'))
 
 
-def export_article_html(article: Article, filepath: str) -> None:
-    """Export article as basic HTML file."""
-    # Simple markdown to HTML conversion
-    import re
+def _basic_markdown_to_html(content: str) -> str:
+    """Minimal markdown to HTML conversion used when mistune is not installed."""
+    html_content = content
     
-    html_content = article.content
-    
-    # Headers
-    html_content = re.sub(r'^### (.+)$', r'<h3>\1</h3>', html_content, flags=re.MULTILINE)
-    html_content = re.sub(r'^## (.+)$', r'<h2>\1</h2>', html_content, flags=re.MULTILINE)
-    html_content = re.sub(r'^# (.+)$', r'<h1>\1</h1>', html_content, flags=re.MULTILINE)
+    # Headers (h1-h3 in a single pass)
+    html_content = _HEADING_RE.sub(_heading_to_html, html_content)
     
     # Bold and italic
-    html_content = re.sub(r'\*\*(.+?)\*\*', r'<strong>\1</strong>', html_content)
-    html_content = re.sub(r'\*(.+?)\*', r'<em>\1</em>', html_content)
+    html_content = _BOLD_RE.sub(r'<strong>\1</strong>', html_content)
+    html_content = _ITALIC_RE.sub(r'<em>\1</em>', html_content)
     
     # Paragraphs
     paragraphs = html_content.split('\n\n')
@@ -564,7 +1152,7 @@ def export_article_html(article: Article, filepath: str) -> None:
                 # List item
                 items = [item.strip()[1:].strip() for item in p.split('\n') if item.strip()]
                 p = '<ul>\n' + '\n'.join(f'<li>{item}</li>' for item in items) + '\n</ul>'
-            elif p[0].isdigit() and p[1] == '.':
+            elif len(p) > 1 and p[0].isdigit() and p[1] == '.':
                 # Numbered list
                 items = [item.strip().split('.', 1)[1].strip() for item in p.split('\n') if item.strip()]
                 p = '<ol>\n' + '\n'.join(f'<li>{item}</li>' for item in items) + '\n</ol>'
@@ -572,7 +1160,15 @@ def export_article_html(article: Article, filepath: str) -> None:
                 p = f'<p>{p}</p>'
         html_paragraphs.append(p)
     
-    html_content = '\n\n'.join(html_paragraphs)
+    return '\n\n'.join(html_paragraphs)
+
+
+def export_article_html(article: Article, filepath: str) -> None:
+    """Export article as basic HTML file."""
+    if mistune is not None:
+        html_content = mistune.html(article.content)
+    else:
+        html_content = _basic_markdown_to_html(article.content)
     
     html_template = f"""<!DOCTYPE html>
 <html lang="en">
@@ -600,15 +1196,13 @@ def export_article_html(article: Article, filepath: str) -> None:
 
 def export_all_articles(articles: list[Article], directory: str) -> list[str]:
     """Export all articles to a directory. Returns list of created files."""
-    import os
     os.makedirs(directory, exist_ok=True)
     
     created_files = []
     
     for article in articles:
         # Create safe filename
-        safe_title = "".join(c if c.isalnum() or c in ' -_' else '_' for c in article.title)
-        safe_title = safe_title[:50].strip()
+        safe_title = safe_filename(article.title)
         
         md_path = os.path.join(directory, f"{safe_title}_{article.format.value}.md")
         export_article_md(article, md_path)
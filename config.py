@@ -36,6 +36,7 @@ class Config:
     # UI preferences
     show_timestamps: bool = True
     show_speaker_labels: bool = True
+    last_export_dir: str = ""  # Start folder for article export dialogs
     
     def save(self) -> bool:
         """Save configuration to file."""
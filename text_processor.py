@@ -4,12 +4,20 @@ AI-powered text cleaning and coherence processing using LM Studio
 """
 
 import json
-import urllib.request
-import urllib.error
+import asyncio
+import threading
+import http.client
+from urllib.parse import urlsplit
 from dataclasses import dataclass, field
-from typing import Optional, Callable
+from typing import Optional, Callable, Iterator
 from enum import Enum
 
+try:
+    # Optional: native async HTTP for concurrent LM Studio requests
+    import aiohttp
+except ImportError:
+    aiohttp = None
+
 
 # ============================================================================
 # CONFIGURATION
@@ -20,6 +28,9 @@ DEFAULT_MAX_TOKENS = 4096
 DEFAULT_TEMPERATURE = 0.7
 DEFAULT_TIMEOUT = 300  # 5 minutes for long texts
 
+# Idle keep-alive connections kept per client, shared across threads
+MAX_IDLE_CONNECTIONS = 4
+
 # Chunk size for processing long texts (in characters)
 TEXT_CHUNK_SIZE = 8000
 TEXT_CHUNK_OVERLAP = 500
@@ -74,30 +85,142 @@ class LMStudioClient:
     def __init__(self, base_url: str = DEFAULT_LM_STUDIO_URL):
         self.base_url = base_url.rstrip('/')
         self._cached_model: Optional[str] = None
+        
+        # Idle keep-alive connections shared by all threads. A connection is
+        # checked out for one request at a time (http.client isn't
+        # thread-safe) and put back once its response has been fully read.
+        url = urlsplit(self.base_url)
+        self._connection_class = (
+            http.client.HTTPSConnection if url.scheme == 'https' else http.client.HTTPConnection
+        )
+        self._host = url.netloc
+        self._path_prefix = url.path
+        self._idle_connections: list[http.client.HTTPConnection] = []
+        self._pool_lock = threading.Lock()
+    
+    def _checkout_connection(self) -> Optional[http.client.HTTPConnection]:
+        with self._pool_lock:
+            return self._idle_connections.pop() if self._idle_connections else None
+    
+    def _finish_response(
+        self,
+        conn: http.client.HTTPConnection,
+        response: http.client.HTTPResponse,
+        reusable: bool = True
+    ) -> None:
+        """Return a finished request's connection to the pool, or close it."""
+        if reusable and not response.will_close:
+            with self._pool_lock:
+                if len(self._idle_connections) < MAX_IDLE_CONNECTIONS:
+                    self._idle_connections.append(conn)
+                    return
+        conn.close()
+    
+    def _open_response(
+        self,
+        method: str,
+        path: str,
+        payload: Optional[dict],
+        timeout: float
+    ) -> tuple[http.client.HTTPConnection, http.client.HTTPResponse]:
+        """
+        Send a request over a pooled keep-alive connection.
+        
+        Returns the checked-out connection and the unread response; pass
+        both to _finish_response when done. A reused connection the server
+        has closed while idle is retried once on a fresh one.
+        """
+        body = json.dumps(payload).encode('utf-8') if payload is not None else None
+        headers = {'Content-Type': 'application/json'} if body is not None else {}
+        
+        while True:
+            conn = self._checkout_connection()
+            reused = conn is not None
+            if conn is None:
+                conn = self._connection_class(self._host, timeout=timeout)
+            else:
+                conn.timeout = timeout
+                if conn.sock is not None:
+                    conn.sock.settimeout(timeout)
+            
+            try:
+                conn.request(method, f"{self._path_prefix}{path}", body=body, headers=headers)
+                return conn, conn.getresponse()
+            except (http.client.RemoteDisconnected, ConnectionResetError, BrokenPipeError):
+                conn.close()
+                if reused:
+                    continue  # Stale idle connection: the request never reached the server
+                raise
+            except Exception:
+                conn.close()
+                raise
+    
+    def _request_json(
+        self,
+        method: str,
+        path: str,
+        payload: Optional[dict] = None,
+        timeout: float = DEFAULT_TIMEOUT
+    ) -> dict:
+        """
+        Send a JSON request and return the JSON reply.
+        
+        Raises OSError / http.client.HTTPException on failure, including
+        HTTP error statuses.
+        """
+        conn, response = self._open_response(method, path, payload, timeout)
+        try:
+            data = response.read()
+        except Exception:
+            conn.close()
+            raise
+        
+        self._finish_response(conn, response)
+        if response.status >= 400:
+            raise http.client.HTTPException(f"HTTP {response.status} from {path}: {data[:200]!r}")
+        return json.loads(data.decode('utf-8'))
     
     def check_connection(self) -> bool:
         """Check if LM Studio server is running and accessible."""
         try:
-            req = urllib.request.Request(f"{self.base_url}/models")
-            with urllib.request.urlopen(req, timeout=5) as response:
-                return response.status == 200
+            self._request_json('GET', '/models', timeout=5)
+            return True
         except:
             return False
     
     def get_loaded_model(self) -> Optional[str]:
         """Get the currently loaded model name."""
         try:
-            req = urllib.request.Request(f"{self.base_url}/models")
-            with urllib.request.urlopen(req, timeout=5) as response:
-                data = json.loads(response.read().decode('utf-8'))
-                models = data.get('data', [])
-                if models:
-                    self._cached_model = models[0].get('id', 'Unknown')
-                    return self._cached_model
+            data = self._request_json('GET', '/models', timeout=5)
+            models = data.get('data', [])
+            if models:
+                self._cached_model = models[0].get('id', 'Unknown')
+                return self._cached_model
         except:
             pass
         return None
     
+    def _chat_payload(
+        self,
+        prompt: str,
+        system_prompt: Optional[str],
+        max_tokens: int,
+        temperature: float,
+        stream: bool = False
+    ) -> dict:
+        """Build the request body for the chat completions endpoint."""
+        messages = []
+        if system_prompt:
+            messages.append({"role": "system", "content": system_prompt})
+        messages.append({"role": "user", "content": prompt})
+        
+        return {
+            "messages": messages,
+            "temperature": temperature,
+            "max_tokens": max_tokens,
+            "stream": stream
+        }
+    
     def chat_completion(
         self,
         prompt: str,
@@ -119,33 +242,12 @@ class LMStudioClient:
         Returns:
             The model's response text, or None on error
         """
-        endpoint = f"{self.base_url}/chat/completions"
-        
-        messages = []
-        if system_prompt:
-            messages.append({"role": "system", "content": system_prompt})
-        messages.append({"role": "user", "content": prompt})
-        
-        payload = {
-            "messages": messages,
-            "temperature": temperature,
-            "max_tokens": max_tokens,
-            "stream": False
-        }
-        
         try:
-            data = json.dumps(payload).encode('utf-8')
-            req = urllib.request.Request(
-                endpoint,
-                data=data,
-                headers={'Content-Type': 'application/json'}
+            return self.request_chat_completion(
+                prompt, system_prompt, max_tokens, temperature, timeout
             )
-            
-            with urllib.request.urlopen(req, timeout=timeout) as response:
-                result = json.loads(response.read().decode('utf-8'))
-                return result['choices'][0]['message']['content']
                 
-        except urllib.error.URLError as e:
+        except (OSError, http.client.HTTPException) as e:
             # Silenced - these errors can be frequent during connection checks
             # print(f"LM Studio connection error: {e}")
             return None
@@ -154,6 +256,127 @@ class LMStudioClient:
             # print(f"LM Studio API error: {e}")
             return None
 
+    
+    def request_chat_completion(
+        self,
+        prompt: str,
+        system_prompt: Optional[str] = None,
+        max_tokens: int = DEFAULT_MAX_TOKENS,
+        temperature: float = DEFAULT_TEMPERATURE,
+        timeout: int = DEFAULT_TIMEOUT
+    ) -> str:
+        """
+        Same as chat_completion, but errors are raised instead of returning None.
+        
+        Raises OSError / http.client.HTTPException on connection or HTTP
+        errors, and KeyError / ValueError on a malformed reply.
+        """
+        payload = self._chat_payload(prompt, system_prompt, max_tokens, temperature)
+        result = self._request_json('POST', '/chat/completions', payload, timeout)
+        return result['choices'][0]['message']['content']
+    
+    async def achat_completion(
+        self,
+        prompt: str,
+        system_prompt: Optional[str] = None,
+        max_tokens: int = DEFAULT_MAX_TOKENS,
+        temperature: float = DEFAULT_TEMPERATURE,
+        timeout: int = DEFAULT_TIMEOUT,
+        session: Optional["aiohttp.ClientSession"] = None
+    ) -> Optional[str]:
+        """
+        Async variant of chat_completion.
+        
+        Uses aiohttp when installed; otherwise runs chat_completion in a
+        worker thread. Returns None on error, like chat_completion.
+        
+        Pass a session from async_session() to reuse its connections across
+        a batch of requests; without one a throwaway session is opened.
+        """
+        if aiohttp is None:
+            return await asyncio.to_thread(
+                self.chat_completion, prompt, system_prompt, max_tokens, temperature, timeout
+            )
+        
+        endpoint = f"{self.base_url}/chat/completions"
+        payload = self._chat_payload(prompt, system_prompt, max_tokens, temperature)
+        
+        try:
+            client_timeout = aiohttp.ClientTimeout(total=timeout)
+            if session is None:
+                async with aiohttp.ClientSession() as own_session:
+                    return await self._apost_chat(own_session, endpoint, payload, client_timeout)
+            return await self._apost_chat(session, endpoint, payload, client_timeout)
+        except Exception:
+            # Silenced - same contract as chat_completion
+            return None
+    
+    @staticmethod
+    async def _apost_chat(session, endpoint: str, payload: dict, timeout) -> str:
+        async with session.post(endpoint, json=payload, timeout=timeout) as response:
+            result = await response.json(content_type=None)
+            return result['choices'][0]['message']['content']
+    
+    def async_session(self) -> Optional["aiohttp.ClientSession"]:
+        """
+        Open an aiohttp session to share across achat_completion calls.
+        
+        Must be called inside the running event loop; the caller closes it.
+        Returns None when aiohttp is not installed.
+        """
+        if aiohttp is None:
+            return None
+        return aiohttp.ClientSession()
+    
+    def chat_completion_stream(
+        self,
+        prompt: str,
+        system_prompt: Optional[str] = None,
+        max_tokens: int = DEFAULT_MAX_TOKENS,
+        temperature: float = DEFAULT_TEMPERATURE,
+        timeout: int = DEFAULT_TIMEOUT
+    ) -> Iterator[str]:
+        """
+        Stream a chat completion from LM Studio as content chunks (SSE).
+        
+        Same arguments as chat_completion; timeout applies per read.
+        Unlike chat_completion, errors are raised so callers can tell a
+        truncated stream from a complete one.
+        
+        Yields:
+            Content chunks in generation order
+        """
+        payload = self._chat_payload(
+            prompt, system_prompt, max_tokens, temperature, stream=True
+        )
+        
+        conn, response = self._open_response('POST', '/chat/completions', payload, timeout)
+        completed = False
+        try:
+            if response.status >= 400:
+                raise http.client.HTTPException(
+                    f"HTTP {response.status} from /chat/completions: {response.read()[:200]!r}"
+                )
+            
+            for raw_line in response:
+                line = raw_line.decode('utf-8').strip()
+                if not line.startswith('data:'):
+                    continue
+                
+                event = line[5:].strip()
+                if event == '[DONE]':
+                    break
+                
+                choices = json.loads(event).get('choices') or [{}]
+                content = choices[0].get('delta', {}).get('content')
+                if content:
+                    yield content
+            
+            response.read()  # Drain the terminating chunk so the socket can be reused
+            completed = True
+        finally:
+            # An abandoned or failed stream leaves unread data on the socket
+            self._finish_response(conn, response, reusable=completed)
 
 # ============================================================================
 # TEXT CLEANER
@@ -9,7 +9,7 @@ import tempfile
 import subprocess
 import shutil
 from dataclasses import dataclass
-from typing import Callable, Optional, List
+from typing import Callable, Optional, List, Tuple
 from PyQt6.QtCore import QObject, pyqtSignal, QThread
 
 from pywhispercpp.model import Model
@@ -258,7 +258,22 @@ class Transcriber:
     
     def __init__(self):
         self.current_worker: Optional[TranscriptionWorker] = None
-        self.gpu_type, self.gpu_name = detect_gpu()
+        self._gpu_info: Optional[Tuple[str, str]] = None  # Detected lazily (spawns subprocesses)
+    
+    @property
+    def gpu_info(self) -> Tuple[str, str]:
+        """(gpu_type, description) from detect_gpu(), probed on first access."""
+        if self._gpu_info is None:
+            self._gpu_info = detect_gpu()
+        return self._gpu_info
+    
+    @property
+    def gpu_type(self) -> str:
+        return self.gpu_info[0]
+    
+    @property
+    def gpu_name(self) -> str:
+        return self.gpu_info[1]
     
     def is_busy(self) -> bool:
         """Check if a transcription is in progress."""
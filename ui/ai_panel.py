@@ -3,26 +3,155 @@ Whisper Fedora UI - AI Processing Panel
 Controls for AI-powered text processing and article generation
 """
 
+import time
+
 from PyQt6.QtWidgets import (
     QWidget, QVBoxLayout, QHBoxLayout, QPushButton, 
-    QLabel, QComboBox, QProgressBar, QFrame, QCheckBox
+    QLabel, QComboBox, QProgressBar, QFrame, QCheckBox, QApplication
 )
-from PyQt6.QtCore import Qt, pyqtSignal, QTimer
+from PyQt6.QtCore import Qt, pyqtSignal, QTimer, QThread, QEvent
 from PyQt6.QtGui import QFont
 
 from text_processor import TextProcessor
-from article_generator import ArticleGenerator, ArticleFormat, ARTICLE_FORMAT_INFO
+from article_generator import ArticleGenerator, ArticleFormat, ARTICLE_FORMAT_DISPLAY
 from lm_studio_manager import LMStudioManager
 
 
+# Stylesheets are built once at import. The action-button rules are applied
+# at panel level (matching the "action" property) so Qt parses them once
+# rather than once per button. Solid backgrounds prevent bleed-through.
+ACTION_BUTTON_QSS = """
+QPushButton[action="true"] {
+    background-color: #2d2d2d;
+    border: 1px solid #404040;
+    border-radius: 6px;
+    padding: 8px 12px;
+    color: #e0e0e0;
+    font-size: 12px;
+    text-align: left;
+}
+QPushButton[action="true"]:hover {
+    background-color: #3a3a3a;
+    border-color: #5a5a5a;
+}
+QPushButton[action="true"]:pressed {
+    background-color: #4a4a4a;
+}
+QPushButton[action="true"]:disabled {
+    background-color: #252525;
+    color: #606060;
+    border-color: #333333;
+}
+"""
+
+MODEL_COMBO_QSS = """
+QComboBox {
+    padding: 4px 6px;
+    padding-right: 18px;
+    border: 1px solid #3a3a3a;
+    border-radius: 4px;
+    background-color: #2a2a2a;
+    color: #e0e0e0;
+    font-size: 10px;
+}
+QComboBox:hover { border-color: #5a5a5a; }
+QComboBox::drop-down { width: 14px; border: none; }
+QComboBox::down-arrow { border-left: 3px solid transparent; border-right: 3px solid transparent; border-top: 3px solid #888; }
+QComboBox QAbstractItemView { background-color: #2a2a2a; border: 1px solid #3a3a3a; selection-background-color: #6366f1; color: #e0e0e0; }
+"""
+
+FORMAT_COMBO_QSS = """
+QComboBox {
+    padding: 6px 8px;
+    padding-right: 20px;
+    border: 1px solid #3a3a3a;
+    border-radius: 6px;
+    background-color: #2a2a2a;
+    color: #e0e0e0;
+    font-size: 11px;
+}
+QComboBox:hover {
+    border-color: #5a5a5a;
+}
+QComboBox::drop-down {
+    subcontrol-origin: padding;
+    subcontrol-position: center right;
+    width: 16px;
+    border: none;
+}
+QComboBox::down-arrow {
+    width: 0;
+    height: 0;
+    border-left: 3px solid transparent;
+    border-right: 3px solid transparent;
+    border-top: 3px solid #888;
+}
+QComboBox QAbstractItemView {
+    background-color: #2a2a2a;
+    border: 1px solid #3a3a3a;
+    selection-background-color: #6366f1;
+    color: #e0e0e0;
+}
+"""
+
+PROGRESS_BAR_QSS = """
+QProgressBar { 
+    border: none; 
+    border-radius: 3px; 
+    background-color: #2a2a2a; 
+    height: 4px; 
+}
+QProgressBar::chunk { 
+    background-color: #6366f1; 
+    border-radius: 3px; 
+}
+"""
+
+# Connection polling: every 30s while connected. While offline, start at 2s
+# (so a freshly started server is picked up fast) and double up to 5 min.
+# Polling pauses while the window is inactive, minimized or hidden, or the
+# application is suspended. Event-driven checks (window
+# activation, button clicks) reuse a successful probe younger than the TTL.
+CHECK_INTERVAL_MS = 30000
+OFFLINE_CHECK_INTERVAL_MS = 2000
+MAX_OFFLINE_CHECK_INTERVAL_MS = 300000
+CONNECTED_PROBE_TTL = 30.0  # seconds
+
+# Progress updates arrive in bursts from worker callbacks; repaint at most ~30Hz
+PROGRESS_FLUSH_INTERVAL_MS = 33
+
+
+class ConnectionCheckWorker(QThread):
+    """Background probe of the LM Studio server, keeping HTTP off the GUI thread."""
+    
+    checked = pyqtSignal(bool, object)  # connected, model name (or None)
+    
+    def __init__(self, processor: TextProcessor):
+        super().__init__()
+        self._processor = processor
+    
+    def run(self):
+        # Both calls hit /models; a model listing already proves the server is up
+        model_name = self._processor.get_model_name()
+        connected = model_name is not None or self._processor.is_available()
+        self.checked.emit(connected, model_name)
+
+
 class StatusIndicator(QWidget):
     """Small status indicator with colored dot and label."""
     
+    # Pre-built stylesheets; compared before applying to avoid needless repolish
+    _DOT_GREEN = "color: #22c55e; font-size: 10px;"
+    _DOT_RED = "color: #ef4444; font-size: 10px;"
+    _LABEL_GREEN = "color: #22c55e; font-size: 11px;"
+    _LABEL_GRAY = "color: #888; font-size: 11px;"
+    
     def __init__(self, parent=None):
         super().__init__(parent)
         self._setup_ui()
         self._connected = False
         self._model_name = None
+        self._applied_state = None  # (connected, model_name) last rendered
     
     def _setup_ui(self):
         layout = QHBoxLayout(self)
@@ -30,11 +159,11 @@ class StatusIndicator(QWidget):
         layout.setSpacing(6)
         
         self.dot = QLabel("●")
-        self.dot.setStyleSheet("color: #ef4444; font-size: 10px;")  # Red = disconnected
+        self.dot.setStyleSheet(self._DOT_RED)  # Red = disconnected
         layout.addWidget(self.dot)
         
         self.label = QLabel("LM Studio")
-        self.label.setStyleSheet("color: #888; font-size: 11px;")
+        self.label.setStyleSheet(self._LABEL_GRAY)
         layout.addWidget(self.label)
         
         layout.addStretch()
@@ -44,20 +173,36 @@ class StatusIndicator(QWidget):
         self._connected = connected
         self._model_name = model_name
         
+        if (connected, model_name) == self._applied_state:
+            return
+        self._applied_state = (connected, model_name)
+        
         if connected:
-            self.dot.setStyleSheet("color: #22c55e; font-size: 10px;")  # Green
+            dot_style, label_style = self._DOT_GREEN, self._LABEL_GREEN
             if model_name:
                 # Truncate long model names
                 display_name = model_name[:25] + "..." if len(model_name) > 25 else model_name
-                self.label.setText(f"LM Studio: {display_name}")
-                self.label.setStyleSheet("color: #22c55e; font-size: 11px;")
+                text = f"LM Studio: {display_name}"
             else:
-                self.label.setText("LM Studio: Connected")
-                self.label.setStyleSheet("color: #22c55e; font-size: 11px;")
+                text = "LM Studio: Connected"
         else:
-            self.dot.setStyleSheet("color: #ef4444; font-size: 10px;")  # Red
-            self.label.setText("LM Studio: Offline")
-            self.label.setStyleSheet("color: #888; font-size: 11px;")
+            dot_style, label_style = self._DOT_RED, self._LABEL_GRAY
+            text = "LM Studio: Offline"
+        
+        if self.dot.styleSheet() != dot_style:
+            self.dot.setStyleSheet(dot_style)
+        self._apply_label(text, label_style)
+    
+    def set_message(self, text: str, style: str):
+        """Show a transient message; the next set_connected() re-renders."""
+        self._applied_state = None
+        self._apply_label(text, style)
+    
+    def _apply_label(self, text: str, style: str):
+        if self.label.text() != text:
+            self.label.setText(text)
+        if self.label.styleSheet() != style:
+            self.label.setStyleSheet(style)
     
     @property
     def is_connected(self) -> bool:
@@ -80,7 +225,17 @@ class AIProcessingPanel(QWidget):
         self._processing = False
         self._has_transcription = False
         self.check_timer = None  # Initialize timer reference
+        self._check_worker: ConnectionCheckWorker | None = None
+        self._last_probe_ts = 0.0  # time.monotonic() of last successful probe
+        self._watched_window = None  # Top-level window we track activation of
+        self._pending_progress: tuple[int, str] | None = None
         self._setup_ui()
+        
+        self._progress_flush_timer = QTimer(self)
+        self._progress_flush_timer.setSingleShot(True)
+        self._progress_flush_timer.setInterval(PROGRESS_FLUSH_INTERVAL_MS)
+        self._progress_flush_timer.timeout.connect(self._flush_progress)
+        
         self._start_connection_check()
         self._refresh_models()
     
@@ -88,12 +243,16 @@ class AIProcessingPanel(QWidget):
         """Stop timers and cleanup resources."""
         if self.check_timer:
             self.check_timer.stop()
+        if self._check_worker and self._check_worker.isRunning():
+            self._check_worker.wait()
     
     def _setup_ui(self):
         layout = QVBoxLayout(self)
         layout.setContentsMargins(0, 8, 0, 0)
         layout.setSpacing(8)
         
+        self.setStyleSheet(ACTION_BUTTON_QSS)
+        
         # Divider
         divider = QFrame()
         divider.setFrameShape(QFrame.Shape.HLine)
@@ -119,21 +278,7 @@ class AIProcessingPanel(QWidget):
         model_layout.addWidget(model_label)
         
         self.model_combo = QComboBox()
-        self.model_combo.setStyleSheet("""
-            QComboBox {
-                padding: 4px 6px;
-                padding-right: 18px;
-                border: 1px solid #3a3a3a;
-                border-radius: 4px;
-                background-color: #2a2a2a;
-                color: #e0e0e0;
-                font-size: 10px;
-            }
-            QComboBox:hover { border-color: #5a5a5a; }
-            QComboBox::drop-down { width: 14px; border: none; }
-            QComboBox::down-arrow { border-left: 3px solid transparent; border-right: 3px solid transparent; border-top: 3px solid #888; }
-            QComboBox QAbstractItemView { background-color: #2a2a2a; border: 1px solid #3a3a3a; selection-background-color: #6366f1; color: #e0e0e0; }
-        """)
+        self.model_combo.setStyleSheet(MODEL_COMBO_QSS)
         self.model_combo.currentIndexChanged.connect(self._on_model_selected)
         model_layout.addWidget(self.model_combo, stretch=1)
         
@@ -163,18 +308,7 @@ class AIProcessingPanel(QWidget):
         # Progress bar (hidden by default)
         self.progress_bar = QProgressBar()
         self.progress_bar.setVisible(False)
-        self.progress_bar.setStyleSheet("""
-            QProgressBar { 
-                border: none; 
-                border-radius: 3px; 
-                background-color: #2a2a2a; 
-                height: 4px; 
-            }
-            QProgressBar::chunk { 
-                background-color: #6366f1; 
-                border-radius: 3px; 
-            }
-        """)
+        self.progress_bar.setStyleSheet(PROGRESS_BAR_QSS)
         self.progress_bar.setTextVisible(False)
         self.progress_bar.setFixedHeight(4)
         layout.addWidget(self.progress_bar)
@@ -185,34 +319,9 @@ class AIProcessingPanel(QWidget):
         self.progress_label.setVisible(False)
         layout.addWidget(self.progress_label)
         
-        # Button style - use solid backgrounds to prevent bleed-through
-        button_style = """
-            QPushButton {
-                background-color: #2d2d2d;
-                border: 1px solid #404040;
-                border-radius: 6px;
-                padding: 8px 12px;
-                color: #e0e0e0;
-                font-size: 12px;
-                text-align: left;
-            }
-            QPushButton:hover {
-                background-color: #3a3a3a;
-                border-color: #5a5a5a;
-            }
-            QPushButton:pressed {
-                background-color: #4a4a4a;
-            }
-            QPushButton:disabled {
-                background-color: #252525;
-                color: #606060;
-                border-color: #333333;
-            }
-        """
-        
         # Clean Text button
         self.clean_btn = QPushButton("✨ Clean Text")
-        self.clean_btn.setStyleSheet(button_style)
+        self.clean_btn.setProperty("action", True)
         self.clean_btn.setToolTip("Remove filler words, fix punctuation, create paragraphs")
         self.clean_btn.clicked.connect(self._on_clean_clicked)
         self.clean_btn.setEnabled(False)
@@ -223,7 +332,7 @@ class AIProcessingPanel(QWidget):
         articles_layout.setSpacing(4)
         
         self.generate_btn = QPushButton("📝 Generate")
-        self.generate_btn.setStyleSheet(button_style)
+        self.generate_btn.setProperty("action", True)
         self.generate_btn.setToolTip("Generate article in selected format")
         self.generate_btn.clicked.connect(self._on_generate_clicked)
         self.generate_btn.setEnabled(False)
@@ -232,53 +341,19 @@ class AIProcessingPanel(QWidget):
         # Format selector
         self.format_combo = QComboBox()
         self.format_combo.setFixedWidth(90)
-        self.format_combo.setStyleSheet("""
-            QComboBox {
-                padding: 6px 8px;
-                padding-right: 20px;
-                border: 1px solid #3a3a3a;
-                border-radius: 6px;
-                background-color: #2a2a2a;
-                color: #e0e0e0;
-                font-size: 11px;
-            }
-            QComboBox:hover {
-                border-color: #5a5a5a;
-            }
-            QComboBox::drop-down {
-                subcontrol-origin: padding;
-                subcontrol-position: center right;
-                width: 16px;
-                border: none;
-            }
-            QComboBox::down-arrow {
-                width: 0;
-                height: 0;
-                border-left: 3px solid transparent;
-                border-right: 3px solid transparent;
-                border-top: 3px solid #888;
-            }
-            QComboBox QAbstractItemView {
-                background-color: #2a2a2a;
-                border: 1px solid #3a3a3a;
-                selection-background-color: #6366f1;
-                color: #e0e0e0;
-            }
-        """)
+        self.format_combo.setStyleSheet(FORMAT_COMBO_QSS)
         
         # Add format options
         for fmt in ArticleFormat:
-            info = ARTICLE_FORMAT_INFO[fmt]
             # Use emoji in text, not as icon (QIcon requires actual icon, not string)
-            display_text = f"{info['icon']} {info['name'].split()[1]}"
-            self.format_combo.addItem(display_text, fmt.value)
+            self.format_combo.addItem(ARTICLE_FORMAT_DISPLAY[fmt], fmt.value)
         
         articles_layout.addWidget(self.format_combo)
         layout.addLayout(articles_layout)
         
         # Generate All button
         self.generate_all_btn = QPushButton("📚 Generate All Formats")
-        self.generate_all_btn.setStyleSheet(button_style)
+        self.generate_all_btn.setProperty("action", True)
         self.generate_all_btn.setToolTip("Generate articles in all 5 formats")
         self.generate_all_btn.clicked.connect(self._on_generate_all_clicked)
         self.generate_all_btn.setEnabled(False)
@@ -290,20 +365,86 @@ class AIProcessingPanel(QWidget):
         """Start periodic connection check."""
         self._check_connection()
         
-        # Check connection every 10 seconds
         self.check_timer = QTimer(self)
-        self.check_timer.timeout.connect(self._check_connection)
-        self.check_timer.start(10000)
+        self.check_timer.timeout.connect(lambda: self._check_connection(force=True))
+        self.check_timer.start(CHECK_INTERVAL_MS)
+        
+        app = QApplication.instance()
+        if app is not None:
+            app.applicationStateChanged.connect(self._on_application_state_changed)
+    
+    def _pause_polling(self):
+        if self.check_timer:
+            self.check_timer.stop()
+    
+    def _resume_polling(self):
+        """Restart polling with an immediate check, if the panel is on screen."""
+        if self.check_timer and self.isVisible():
+            self.check_timer.start()
+            self._check_connection()
+    
+    def showEvent(self, event):
+        super().showEvent(event)
+        # The top-level window only exists once we're placed in it
+        window = self.window()
+        if window is not self._watched_window:
+            if self._watched_window is not None:
+                self._watched_window.removeEventFilter(self)
+            window.installEventFilter(self)
+            self._watched_window = window
+        self._resume_polling()
     
-    def _check_connection(self):
-        """Check LM Studio connection status."""
+    def hideEvent(self, event):
+        # Also delivered when the window is minimized
+        super().hideEvent(event)
+        self._pause_polling()
+    
+    def eventFilter(self, obj, event):
+        """Pause polling while the window is inactive; re-check on activation."""
+        if obj is self._watched_window:
+            if event.type() == QEvent.Type.WindowDeactivate:
+                self._pause_polling()
+            elif event.type() == QEvent.Type.WindowActivate:
+                self._resume_polling()
+        return super().eventFilter(obj, event)
+    
+    def _on_application_state_changed(self, state: Qt.ApplicationState):
+        if state in (Qt.ApplicationState.ApplicationSuspended, Qt.ApplicationState.ApplicationHidden):
+            self._pause_polling()
+        elif state == Qt.ApplicationState.ApplicationActive:
+            self._resume_polling()
+    
+    def _check_connection(self, force: bool = False):
+        """Start a background LM Studio connection check."""
         if self._processing:
             return  # Don't check while processing
-        
-        connected = self._processor.is_available()
-        model_name = self._processor.get_model_name() if connected else None
+        if self._check_worker and self._check_worker.isRunning():
+            return  # Previous probe still in flight
+        if (not force and self.status_indicator.is_connected
+                and time.monotonic() - self._last_probe_ts < CONNECTED_PROBE_TTL):
+            return  # Recent successful probe is still trusted
+        
+        self._check_worker = ConnectionCheckWorker(self._processor)
+        self._check_worker.checked.connect(self._on_connection_checked)
+        self._check_worker.start()
+    
+    def _on_connection_checked(self, connected: bool, model_name):
+        """Apply the result of a background connection check."""
         self.status_indicator.set_connected(connected, model_name)
         
+        # Steady cadence while connected, exponential backoff while offline
+        self._last_probe_ts = time.monotonic() if connected else 0.0
+        if self.check_timer:
+            current = self.check_timer.interval()
+            if connected:
+                interval = CHECK_INTERVAL_MS
+            elif current == CHECK_INTERVAL_MS:
+                interval = OFFLINE_CHECK_INTERVAL_MS  # Just went offline
+            else:
+                interval = min(current * 2, MAX_OFFLINE_CHECK_INTERVAL_MS)
+            if current != interval:
+                self.check_timer.setInterval(interval)
+        
         # Update UI based on connection and CLI availability
         cli_available = self._manager.is_cli_available()
         self.model_row.setVisible(cli_available and connected)
@@ -349,8 +490,7 @@ class AIProcessingPanel(QWidget):
             return  # Already loaded
         
         # Load the selected model
-        self.status_indicator.label.setText("Loading model...")
-        self.status_indicator.label.setStyleSheet("color: #f59e0b; font-size: 11px;")
+        self.status_indicator.set_message("Loading model...", "color: #f59e0b; font-size: 11px;")
         
         # Use a timer to avoid blocking UI
         QTimer.singleShot(100, lambda: self._load_model(model_path))
@@ -360,10 +500,9 @@ class AIProcessingPanel(QWidget):
         success = self._manager.load_model(model_path, gpu="auto")
         
         if success:
-            self._check_connection()
+            self._check_connection(force=True)
         else:
-            self.status_indicator.label.setText("Failed to load model")
-            self.status_indicator.label.setStyleSheet("color: #ef4444; font-size: 11px;")
+            self.status_indicator.set_message("Failed to load model", "color: #ef4444; font-size: 11px;")
     
     def _start_server(self):
         """Start LM Studio server."""
@@ -378,7 +517,7 @@ class AIProcessingPanel(QWidget):
         success = self._manager.start_server(wait=True, timeout=30)
         
         if success:
-            self._check_connection()
+            self._check_connection(force=True)
             self._refresh_models()
         else:
             self.start_server_btn.setText("Failed - Retry")
@@ -389,43 +528,65 @@ class AIProcessingPanel(QWidget):
         connected = self.status_indicator.is_connected
         enabled = self._has_transcription and connected and not self._processing
         
-        self.clean_btn.setEnabled(enabled)
-        self.generate_btn.setEnabled(enabled)
-        self.generate_all_btn.setEnabled(enabled)
+        for btn in (self.clean_btn, self.generate_btn, self.generate_all_btn):
+            if btn.isEnabled() != enabled:
+                btn.setEnabled(enabled)
     
     def set_has_transcription(self, has_transcription: bool):
         """Enable/disable buttons based on transcription availability."""
+        if has_transcription == self._has_transcription:
+            return
         self._has_transcription = has_transcription
         self._update_button_states()
     
     def set_processing(self, processing: bool):
         """Set processing state."""
+        if processing == self._processing:
+            return
         self._processing = processing
         self.progress_bar.setVisible(processing)
         self.progress_label.setVisible(processing)
         
         if not processing:
+            self._progress_flush_timer.stop()
+            self._pending_progress = None
             self.progress_bar.setValue(0)
             self.progress_label.setText("")
         
         self._update_button_states()
     
     def update_progress(self, percentage: int, message: str):
-        """Update progress display."""
-        self.progress_bar.setValue(percentage)
-        self.progress_label.setText(message)
+        """Queue a progress display update; applied on the next flush tick."""
+        self._pending_progress = (percentage, message)
+        if not self._progress_flush_timer.isActive():
+            self._progress_flush_timer.start()
+    
+    def _flush_progress(self):
+        """Apply the latest queued progress values, skipping unchanged ones."""
+        if self._pending_progress is None:
+            return
+        percentage, message = self._pending_progress
+        self._pending_progress = None
+        
+        if self.progress_bar.value() != percentage:
+            self.progress_bar.setValue(percentage)
+        if self.progress_label.text() != message:
+            self.progress_label.setText(message)
     
     def _on_clean_clicked(self):
         """Handle Clean Text button click."""
+        self._check_connection()
         self.clean_requested.emit()
     
     def _on_generate_clicked(self):
         """Handle Generate button click."""
         format_key = self.format_combo.currentData()
+        self._check_connection()
         self.generate_requested.emit(format_key)
     
     def _on_generate_all_clicked(self):
         """Handle Generate All button click."""
+        self._check_connection()
         self.generate_all_requested.emit()
     
     def get_selected_format(self) -> ArticleFormat:
@@ -3,18 +3,124 @@ Whisper Fedora UI - Article View Widget
 Display and export generated articles with tabbed interface
 """
 
+import os
+
 from PyQt6.QtWidgets import (
     QWidget, QVBoxLayout, QHBoxLayout, QTabWidget, QTabBar,
-    QTextEdit, QPushButton, QLabel, QFileDialog, QScrollArea,
+    QTextEdit, QPlainTextEdit, QPushButton, QLabel, QFileDialog, QScrollArea,
     QFrame, QApplication, QMessageBox
 )
-from PyQt6.QtCore import Qt, pyqtSignal
-from PyQt6.QtGui import QFont
+from PyQt6.QtCore import Qt, pyqtSignal, pyqtSlot, QThread, QStandardPaths, QByteArray
+from PyQt6.QtGui import QFont, QImage, QTextDocument
 
 from article_generator import (
-    Article, ArticleFormat, ARTICLE_FORMAT_INFO,
-    export_article_md, export_article_html, export_all_articles
+    Article, ArticleFormat, ARTICLE_FORMAT_DISPLAY,
+    export_article_md, export_article_html, export_all_articles, safe_filename
 )
+from config import get_config, save_config
+
+
+# Applied once per ArticleTab so its buttons share a single parsed stylesheet
+ARTICLE_TAB_QSS = """
+QPushButton {
+    background-color: #2a2a2a;
+    border: 1px solid #3a3a3a;
+    border-radius: 6px;
+    padding: 8px 16px;
+    color: #e0e0e0;
+    font-size: 12px;
+}
+QPushButton:hover {
+    background-color: #3a3a3a;
+    border-color: #5a5a5a;
+}
+QPushButton:pressed {
+    background-color: #4a4a4a;
+}
+QPushButton:disabled {
+    background-color: #1a1a1a;
+    color: #555;
+}
+"""
+
+
+# Shared editor font, created on first use (needs a QApplication)
+_mono_font: QFont | None = None
+
+
+def _get_mono_font() -> QFont:
+    global _mono_font
+    if _mono_font is None:
+        _mono_font = QFont("SF Mono", 12)
+    return _mono_font
+
+
+def _export_start_dir() -> str:
+    """Folder export dialogs open in: the last one used, else Documents."""
+    last_dir = get_config().last_export_dir
+    if last_dir and os.path.isdir(last_dir):
+        return last_dir
+    return QStandardPaths.writableLocation(QStandardPaths.StandardLocation.DocumentsLocation)
+
+
+def _remember_export_dir(directory: str) -> None:
+    config = get_config()
+    if config.last_export_dir != directory:
+        config.last_export_dir = directory
+        save_config()
+
+
+class ExportWorker(QThread):
+    """Runs an export function off the GUI thread."""
+    
+    done = pyqtSignal(object)  # Export function's return value
+    error = pyqtSignal(str)    # Error message
+    
+    def __init__(self, func, *args, parent=None):
+        super().__init__(parent)
+        self._func = func
+        self._args = args
+    
+    def run(self):
+        try:
+            self.done.emit(self._func(*self._args))
+        except Exception as e:
+            self.error.emit(str(e))
+
+
+class MarkdownView(QTextEdit):
+    """Read-only QTextEdit for generated Markdown."""
+    
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self.setReadOnly(True)
+        # No undo snapshots for a view that is only ever replaced wholesale
+        self.setUndoRedoEnabled(False)
+    
+    def set_markdown(self, text: str):
+        """Parse Markdown into a detached document, then swap it in.
+        
+        The new document has no view attached while it's built, so Qt lays
+        it out once on swap instead of incrementally per block.
+        """
+        doc = QTextDocument(self)
+        doc.setUndoRedoEnabled(False)
+        doc.setDefaultFont(self.font())
+        doc.setMarkdown(text)
+        
+        old_doc = self.document()
+        self.setDocument(doc)
+        if old_doc.parent() is self:
+            old_doc.deleteLater()
+    
+    def loadResource(self, type: int, name):
+        # Generated content may reference images that don't exist; never
+        # hit the filesystem or network resolving them. A null result would
+        # make QTextDocument fall back to reading the file itself, so return
+        # an empty (but non-null) value instead.
+        if type == QTextDocument.ResourceType.ImageResource.value:
+            return QImage()
+        return QByteArray()
 
 
 class ArticleTab(QWidget):
@@ -26,6 +132,9 @@ class ArticleTab(QWidget):
     def __init__(self, parent=None):
         super().__init__(parent)
         self._article: Article | None = None
+        self._dirty = False  # Article set but content_edit not yet rendered
+        self._rendered_content: str | None = None  # Markdown currently in content_edit
+        self._export_worker: ExportWorker | None = None
         self._setup_ui()
     
     def _setup_ui(self):
@@ -33,6 +142,8 @@ class ArticleTab(QWidget):
         layout.setContentsMargins(0, 8, 0, 0)
         layout.setSpacing(8)
         
+        self.setStyleSheet(ARTICLE_TAB_QSS)
+        
         # Title and stats row
         header = QHBoxLayout()
         
@@ -48,8 +159,7 @@ class ArticleTab(QWidget):
         layout.addLayout(header)
         
         # Content area
-        self.content_edit = QTextEdit()
-        self.content_edit.setReadOnly(True)
+        self.content_edit = MarkdownView()
         self.content_edit.setStyleSheet("""
             QTextEdit {
                 background-color: #1e1e1e;
@@ -61,49 +171,24 @@ class ArticleTab(QWidget):
                 line-height: 1.6;
             }
         """)
-        self.content_edit.setFont(QFont("SF Mono", 12))
+        self.content_edit.setFont(_get_mono_font())
         layout.addWidget(self.content_edit, stretch=1)
         
         # Action buttons
         actions = QHBoxLayout()
         actions.setSpacing(8)
         
-        button_style = """
-            QPushButton {
-                background-color: #2a2a2a;
-                border: 1px solid #3a3a3a;
-                border-radius: 6px;
-                padding: 8px 16px;
-                color: #e0e0e0;
-                font-size: 12px;
-            }
-            QPushButton:hover {
-                background-color: #3a3a3a;
-                border-color: #5a5a5a;
-            }
-            QPushButton:pressed {
-                background-color: #4a4a4a;
-            }
-            QPushButton:disabled {
-                background-color: #1a1a1a;
-                color: #555;
-            }
-        """
-        
         self.copy_btn = QPushButton("📋 Copy")
-        self.copy_btn.setStyleSheet(button_style)
         self.copy_btn.clicked.connect(self._on_copy)
         self.copy_btn.setEnabled(False)
         actions.addWidget(self.copy_btn)
         
         self.export_md_btn = QPushButton("💾 Export .md")
-        self.export_md_btn.setStyleSheet(button_style)
         self.export_md_btn.clicked.connect(lambda: self._on_export('md'))
         self.export_md_btn.setEnabled(False)
         actions.addWidget(self.export_md_btn)
         
         self.export_html_btn = QPushButton("🌐 Export .html")
-        self.export_html_btn.setStyleSheet(button_style)
         self.export_html_btn.clicked.connect(lambda: self._on_export('html'))
         self.export_html_btn.setEnabled(False)
         actions.addWidget(self.export_html_btn)
@@ -120,22 +205,60 @@ class ArticleTab(QWidget):
     def set_article(self, article: Article):
         """Set the article to display."""
         self._article = article
-        
-        self.title_label.setText(article.title)
-        self.content_edit.setMarkdown(article.content)
-        self.stats_label.setText(f"{article.word_count} words")
-        
-        if article.quality_score > 0:
-            self.score_label.setText(f"Quality: {article.quality_score:.1f}/10")
-        
-        # Enable buttons
-        self.copy_btn.setEnabled(True)
-        self.export_md_btn.setEnabled(True)
-        self.export_html_btn.setEnabled(True)
+        # Re-showing the same content needs no new Markdown parse
+        self._dirty = article.content != self._rendered_content
+        
+        # Repaint once after all labels and the document are updated. Skip
+        # when a parent already batches updates, so we don't re-enable early.
+        batch = self.updatesEnabled()
+        if batch:
+            self.setUpdatesEnabled(False)
+        try:
+            self._set_label_text(self.title_label, article.title)
+            self._set_label_text(self.stats_label, f"{article.word_count} words")
+            
+            if article.quality_score > 0:
+                self._set_label_text(self.score_label, f"Quality: {article.quality_score:.1f}/10")
+            
+            # Enable buttons
+            self.copy_btn.setEnabled(True)
+            self.export_md_btn.setEnabled(True)
+            self.export_html_btn.setEnabled(True)
+            
+            # Markdown parsing is the expensive part; hidden tabs defer it to showEvent
+            if self.isVisible():
+                self._render_if_dirty()
+        finally:
+            if batch:
+                self.setUpdatesEnabled(True)
+    
+    def _render_if_dirty(self):
+        """Render the article Markdown into the editor if it changed."""
+        if not self._dirty or self._article is None:
+            return
+        self._dirty = False
+        
+        self.content_edit.blockSignals(True)
+        try:
+            self.content_edit.set_markdown(self._article.content)
+            self._rendered_content = self._article.content
+        finally:
+            self.content_edit.blockSignals(False)
+    
+    @staticmethod
+    def _set_label_text(label: QLabel, text: str):
+        if label.text() != text:
+            label.setText(text)
+    
+    def showEvent(self, event):
+        self._render_if_dirty()
+        super().showEvent(event)
     
     def clear(self):
         """Clear the article display."""
         self._article = None
+        self._dirty = False
+        self._rendered_content = None
         self.title_label.setText("No article")
         self.content_edit.clear()
         self.stats_label.setText("")
@@ -160,34 +283,61 @@ class ArticleTab(QWidget):
         """Export article to file."""
         if not self._article:
             return
+        if self._export_worker and self._export_worker.isRunning():
+            return
         
         # Create safe filename
-        safe_title = "".join(c if c.isalnum() or c in ' -_' else '_' for c in self._article.title)
-        safe_title = safe_title[:50].strip()
+        safe_title = safe_filename(self._article.title)
+        start_dir = _export_start_dir()
         
         if format == 'md':
             filepath, _ = QFileDialog.getSaveFileName(
-                self, "Export Markdown", f"{safe_title}.md",
+                self, "Export Markdown", os.path.join(start_dir, f"{safe_title}.md"),
                 "Markdown Files (*.md);;All Files (*)"
             )
-            if filepath:
-                try:
-                    export_article_md(self._article, filepath)
-                    self.export_requested.emit()
-                except Exception as e:
-                    QMessageBox.critical(self, "Export Error", str(e))
-        
+            export_func = export_article_md
         elif format == 'html':
             filepath, _ = QFileDialog.getSaveFileName(
-                self, "Export HTML", f"{safe_title}.html",
+                self, "Export HTML", os.path.join(start_dir, f"{safe_title}.html"),
                 "HTML Files (*.html);;All Files (*)"
             )
-            if filepath:
-                try:
-                    export_article_html(self._article, filepath)
-                    self.export_requested.emit()
-                except Exception as e:
-                    QMessageBox.critical(self, "Export Error", str(e))
+            export_func = export_article_html
+        else:
+            return
+        
+        if filepath:
+            _remember_export_dir(os.path.dirname(filepath))
+            
+            # Write in the background so the UI stays responsive
+            self._set_export_enabled(False)
+            self._export_worker = ExportWorker(export_func, self._article, filepath, parent=self)
+            self._export_worker.done.connect(self._on_export_done)
+            self._export_worker.error.connect(self._on_export_error)
+            self._export_worker.finished.connect(self._on_export_worker_finished)
+            self._export_worker.start()
+    
+    def cleanup(self):
+        """Let a running export finish writing before the tab goes away."""
+        if self._export_worker and self._export_worker.isRunning():
+            self._export_worker.wait()
+    
+    def _on_export_worker_finished(self):
+        """Free the finished worker; it is parented to the tab, so it would linger."""
+        if self._export_worker is not None:
+            self._export_worker.deleteLater()
+            self._export_worker = None
+    
+    def _set_export_enabled(self, enabled: bool):
+        self.export_md_btn.setEnabled(enabled)
+        self.export_html_btn.setEnabled(enabled)
+    
+    def _on_export_done(self, _result):
+        self._set_export_enabled(self._article is not None)
+        self.export_requested.emit()
+    
+    def _on_export_error(self, message: str):
+        self._set_export_enabled(self._article is not None)
+        QMessageBox.critical(self, "Export Error", message)
 
 
 class ArticleView(QWidget):
@@ -199,6 +349,7 @@ class ArticleView(QWidget):
     def __init__(self, parent=None):
         super().__init__(parent)
         self._articles: dict[ArticleFormat, Article] = {}
+        self._export_worker: ExportWorker | None = None
         self._setup_ui()
     
     def _setup_ui(self):
@@ -235,14 +386,19 @@ class ArticleView(QWidget):
         self.format_tabs: dict[ArticleFormat, ArticleTab] = {}
         
         for fmt in ArticleFormat:
-            info = ARTICLE_FORMAT_INFO[fmt]
             tab = ArticleTab()
-            tab.copy_requested.connect(lambda: self.copy_done.emit())
-            tab.export_requested.connect(lambda: self.export_done.emit("exported"))
+            tab.copy_requested.connect(self.copy_done)  # Signal-to-signal, no Python shim
+            tab.export_requested.connect(self._on_tab_exported)
             
-            self.tabs.addTab(tab, f"{info['icon']} {info['name'].split()[1]}")
+            self.tabs.addTab(tab, ARTICLE_FORMAT_DISPLAY[fmt])
             self.format_tabs[fmt] = tab
         
+        # Tab index per format, for O(1) lookup when switching tabs
+        self._format_order: dict[ArticleFormat, int] = {
+            fmt: i for i, fmt in enumerate(self.format_tabs)
+        }
+        
+        self.tabs.currentChanged.connect(self._render_current_tab)
         layout.addWidget(self.tabs)
         
         # Export all button
@@ -278,6 +434,10 @@ class ArticleView(QWidget):
         
         layout.addLayout(export_all_layout)
     
+    @pyqtSlot()
+    def _on_tab_exported(self):
+        self.export_done.emit("exported")
+    
     def set_article(self, article: Article):
         """Set a single article (adds to the appropriate tab)."""
         self._articles[article.format] = article
@@ -285,19 +445,31 @@ class ArticleView(QWidget):
         if article.format in self.format_tabs:
             self.format_tabs[article.format].set_article(article)
             # Switch to the newly added article's tab
-            tab_index = list(ArticleFormat).index(article.format)
-            self.tabs.setCurrentIndex(tab_index)
+            self.tabs.setCurrentIndex(self._format_order[article.format])
         
         self._update_export_all_button()
     
     def set_articles(self, articles: list[Article]):
         """Set multiple articles at once."""
-        for article in articles:
-            self._articles[article.format] = article
-            if article.format in self.format_tabs:
-                self.format_tabs[article.format].set_article(article)
-        
-        self._update_export_all_button()
+        # One layout/paint pass for the whole batch instead of one per tab
+        self.setUpdatesEnabled(False)
+        self.tabs.blockSignals(True)
+        try:
+            for article in articles:
+                self._articles[article.format] = article
+                if article.format in self.format_tabs:
+                    self.format_tabs[article.format].set_article(article)
+            
+            self._update_export_all_button()
+        finally:
+            self.tabs.blockSignals(False)
+            self.setUpdatesEnabled(True)
+    
+    def _render_current_tab(self, index: int):
+        """Render the newly selected tab's article if it is pending."""
+        tab = self.tabs.widget(index)
+        if isinstance(tab, ArticleTab):
+            tab._render_if_dirty()
     
     def clear(self):
         """Clear all articles."""
@@ -306,6 +478,13 @@ class ArticleView(QWidget):
             tab.clear()
         self.export_all_btn.setEnabled(False)
     
+    def cleanup(self):
+        """Wait for running exports (this view's and its tabs') to finish."""
+        if self._export_worker and self._export_worker.isRunning():
+            self._export_worker.wait()
+        for tab in self.format_tabs.values():
+            tab.cleanup()
+    
     def get_articles(self) -> list[Article]:
         """Get all current articles."""
         return list(self._articles.values())
@@ -323,14 +502,37 @@ class ArticleView(QWidget):
         if not self._articles:
             return
         
-        directory = QFileDialog.getExistingDirectory(self, "Select Export Folder")
+        if self._export_worker and self._export_worker.isRunning():
+            return
+        
+        directory = QFileDialog.getExistingDirectory(
+            self, "Select Export Folder", _export_start_dir()
+        )
         if directory:
-            try:
-                articles = list(self._articles.values())
-                created_files = export_all_articles(articles, directory)
-                self.export_done.emit(f"Exported {len(created_files)} files")
-            except Exception as e:
-                QMessageBox.critical(self, "Export Error", str(e))
+            _remember_export_dir(directory)
+            
+            # Write in the background so the UI stays responsive
+            self.export_all_btn.setEnabled(False)
+            articles = list(self._articles.values())
+            self._export_worker = ExportWorker(export_all_articles, articles, directory, parent=self)
+            self._export_worker.done.connect(self._on_export_all_done)
+            self._export_worker.error.connect(self._on_export_all_error)
+            self._export_worker.finished.connect(self._on_export_worker_finished)
+            self._export_worker.start()
+    
+    def _on_export_worker_finished(self):
+        """Free the finished worker; it is parented to the view, so it would linger."""
+        if self._export_worker is not None:
+            self._export_worker.deleteLater()
+            self._export_worker = None
+    
+    def _on_export_all_done(self, created_files: list[str]):
+        self._update_export_all_button()
+        self.export_done.emit(f"Exported {len(created_files)} files")
+    
+    def _on_export_all_error(self, message: str):
+        self._update_export_all_button()
+        QMessageBox.critical(self, "Export Error", message)
 
 
 class CleanedTextView(QWidget):
@@ -364,10 +566,13 @@ class CleanedTextView(QWidget):
         layout.addLayout(stats)
         
         # Content
-        self.content_edit = QTextEdit()
+        # Plain text only: QPlainTextEdit's line-based layout is much cheaper
+        # than QTextEdit's rich-text document for long transcripts
+        self.content_edit = QPlainTextEdit()
         self.content_edit.setReadOnly(True)
+        self.content_edit.setUndoRedoEnabled(False)
         self.content_edit.setStyleSheet("""
-            QTextEdit {
+            QPlainTextEdit {
                 background-color: #1e1e1e;
                 border: 1px solid #3a3a3a;
                 border-radius: 8px;
@@ -4,16 +4,123 @@ Drag-and-drop file upload with format validation
 """
 
 import os
+import functools
 from PyQt6.QtWidgets import (
-    QWidget, QVBoxLayout, QLabel, QPushButton, QFileDialog, QHBoxLayout
+    QWidget, QVBoxLayout, QLabel, QPushButton, QFileDialog, QHBoxLayout, QMessageBox
 )
-from PyQt6.QtCore import Qt, pyqtSignal
+from PyQt6.QtCore import Qt, pyqtSignal, QThread, QTimer
 from PyQt6.QtGui import QDragEnterEvent, QDropEvent
 
-from utils import is_supported_format, SUPPORTED_FORMATS, get_audio_duration, format_duration
+from utils import (
+    is_supported_format, has_media_signature, SUPPORTED_FORMATS,
+    get_audio_duration, format_duration
+)
 from ui.icons import IconLabel, get_icon, IconColors
 
 
+# All FileSelector styles, parsed once for the whole widget and matched by
+# objectName. State changes (drag hover, file selected) only flip a dynamic
+# property and repolish, instead of re-setting a stylesheet per event.
+FILE_SELECTOR_QSS = """
+#dropZone {
+    border: 2px dashed #4a4a4a;
+    border-radius: 12px;
+    background-color: rgba(99, 102, 241, 0.05);
+    min-height: 180px;
+}
+#dropZone:hover {
+    border-color: #6366f1;
+    background-color: rgba(99, 102, 241, 0.1);
+}
+#dropZone[dragActive="true"] {
+    border-color: #6366f1;
+    background-color: rgba(99, 102, 241, 0.15);
+}
+QLabel#dropText {
+    color: #888;
+    font-size: 14px;
+}
+QLabel#dropText[fileSelected="true"] {
+    color: #22c55e;
+}
+QLabel#formatsHint {
+    color: #666;
+    font-size: 11px;
+}
+QPushButton#browseBtn {
+    background-color: #6366f1;
+    color: white;
+    border: none;
+    border-radius: 6px;
+    padding: 10px 24px;
+    font-weight: bold;
+}
+QPushButton#browseBtn:hover {
+    background-color: #818cf8;
+}
+QPushButton#browseBtn:pressed {
+    background-color: #4f46e5;
+}
+#fileInfo, #fileInfo QWidget {
+    background-color: rgba(99, 102, 241, 0.1);
+    border-radius: 8px;
+}
+QLabel#fileName {
+    font-weight: bold;
+    margin-left: 8px;
+}
+QLabel#fileDuration {
+    color: #888;
+}
+QPushButton#clearFileBtn {
+    background: transparent;
+    border: none;
+}
+QPushButton#clearFileBtn:hover {
+    background: rgba(248, 113, 113, 0.1);
+    border-radius: 12px;
+}
+"""
+
+
+def _set_style_property(widget: QWidget, name: str, value: bool):
+    """Set a dynamic property used by a QSS selector and restyle if it changed."""
+    if widget.property(name) == value:
+        return
+    widget.setProperty(name, value)
+    # Property selectors are only re-evaluated on repolish
+    style = widget.style()
+    style.unpolish(widget)
+    style.polish(widget)
+
+
+@functools.lru_cache(maxsize=256)
+def _cached_duration(path: str, size: int, mtime_ns: int) -> float | None:
+    """ffprobe duration; size and mtime_ns only key the cache so edits re-probe."""
+    return get_audio_duration(path)
+
+
+def _get_duration(path: str) -> float | None:
+    try:
+        st = os.stat(path)
+    except OSError:
+        return None
+    return _cached_duration(path, st.st_size, st.st_mtime_ns)
+
+
+class DurationProbeWorker(QThread):
+    """Runs the ffprobe duration lookup off the GUI thread."""
+    
+    probed = pyqtSignal(str, object)  # filepath, duration in seconds (or None)
+    
+    def __init__(self, filepath: str):
+        super().__init__()
+        self._filepath = filepath
+    
+    def run(self):
+        self.probed.emit(self._filepath, _get_duration(self._filepath))
+
+
 class FileSelector(QWidget):
     """Drag-and-drop file selector widget."""
     
@@ -23,29 +130,20 @@ class FileSelector(QWidget):
     def __init__(self, parent=None):
         super().__init__(parent)
         self.selected_file = None
+        self._duration_workers: set[DurationProbeWorker] = set()  # Keep running probes alive
         self._setup_ui()
         self.setAcceptDrops(True)
     
     def _setup_ui(self):
         """Set up the UI components."""
+        self.setStyleSheet(FILE_SELECTOR_QSS)
         layout = QVBoxLayout(self)
         layout.setContentsMargins(0, 0, 0, 0)
         
         # Drop zone container
         self.drop_zone = QWidget()
         self.drop_zone.setObjectName("dropZone")
-        self.drop_zone.setStyleSheet("""
-            #dropZone {
-                border: 2px dashed #4a4a4a;
-                border-radius: 12px;
-                background-color: rgba(99, 102, 241, 0.05);
-                min-height: 180px;
-            }
-            #dropZone:hover {
-                border-color: #6366f1;
-                background-color: rgba(99, 102, 241, 0.1);
-            }
-        """)
+        self.drop_zone.setProperty("dragActive", False)
         
         drop_layout = QVBoxLayout(self.drop_zone)
         drop_layout.setAlignment(Qt.AlignmentFlag.AlignCenter)
@@ -57,35 +155,21 @@ class FileSelector(QWidget):
         
         # Text label
         self.text_label = QLabel("Drop audio or video file here")
-        self.text_label.setStyleSheet("color: #888; font-size: 14px;")
+        self.text_label.setObjectName("dropText")
+        self.text_label.setProperty("fileSelected", False)
         self.text_label.setAlignment(Qt.AlignmentFlag.AlignCenter)
         drop_layout.addWidget(self.text_label)
         
         # Browse button
         self.browse_btn = QPushButton("Browse Files")
-        self.browse_btn.setStyleSheet("""
-            QPushButton {
-                background-color: #6366f1;
-                color: white;
-                border: none;
-                border-radius: 6px;
-                padding: 10px 24px;
-                font-weight: bold;
-            }
-            QPushButton:hover {
-                background-color: #818cf8;
-            }
-            QPushButton:pressed {
-                background-color: #4f46e5;
-            }
-        """)
+        self.browse_btn.setObjectName("browseBtn")
         self.browse_btn.setCursor(Qt.CursorShape.PointingHandCursor)
         self.browse_btn.clicked.connect(self._browse_files)
         drop_layout.addWidget(self.browse_btn, alignment=Qt.AlignmentFlag.AlignCenter)
         
         # Formats hint
         formats_hint = QLabel("Supports: MP3, WAV, FLAC, MP4, MKV, and more")
-        formats_hint.setStyleSheet("color: #666; font-size: 11px;")
+        formats_hint.setObjectName("formatsHint")
         formats_hint.setAlignment(Qt.AlignmentFlag.AlignCenter)
         drop_layout.addWidget(formats_hint)
         
@@ -94,12 +178,7 @@ class FileSelector(QWidget):
         # Selected file info (hidden initially)
         self.file_info = QWidget()
         self.file_info.setVisible(False)
-        self.file_info.setStyleSheet("""
-            QWidget {
-                background-color: rgba(99, 102, 241, 0.1);
-                border-radius: 8px;
-            }
-        """)
+        self.file_info.setObjectName("fileInfo")
         file_info_layout = QHBoxLayout(self.file_info)
         file_info_layout.setContentsMargins(12, 10, 12, 10)
         
@@ -108,26 +187,17 @@ class FileSelector(QWidget):
         file_info_layout.addWidget(self.file_icon)
         
         self.file_name_label = QLabel()
-        self.file_name_label.setStyleSheet("font-weight: bold; margin-left: 8px;")
+        self.file_name_label.setObjectName("fileName")
         file_info_layout.addWidget(self.file_name_label, stretch=1)
         
         self.file_duration_label = QLabel()
-        self.file_duration_label.setStyleSheet("color: #888;")
+        self.file_duration_label.setObjectName("fileDuration")
         file_info_layout.addWidget(self.file_duration_label)
         
         self.clear_btn = QPushButton()
         self.clear_btn.setIcon(get_icon('close', IconColors.DEFAULT, 14))
         self.clear_btn.setFixedSize(24, 24)
-        self.clear_btn.setStyleSheet("""
-            QPushButton {
-                background: transparent;
-                border: none;
-            }
-            QPushButton:hover {
-                background: rgba(248, 113, 113, 0.1);
-                border-radius: 12px;
-            }
-        """)
+        self.clear_btn.setObjectName("clearFileBtn")
         self.clear_btn.setCursor(Qt.CursorShape.PointingHandCursor)
         self.clear_btn.clicked.connect(self._clear_selection)
         file_info_layout.addWidget(self.clear_btn)
@@ -136,20 +206,14 @@ class FileSelector(QWidget):
     
     def dragEnterEvent(self, event: QDragEnterEvent):
         """Handle drag enter event."""
+        # Extension check only: no file I/O while hovering (slow on network mounts)
         if event.mimeData().hasUrls():
             urls = event.mimeData().urls()
             if urls and urls[0].isLocalFile():
                 filepath = urls[0].toLocalFile()
                 if is_supported_format(filepath):
                     event.acceptProposedAction()
-                    self.drop_zone.setStyleSheet("""
-                        #dropZone {
-                            border: 2px dashed #6366f1;
-                            border-radius: 12px;
-                            background-color: rgba(99, 102, 241, 0.15);
-                            min-height: 180px;
-                        }
-                    """)
+                    self._set_drag_active(True)
                     return
         event.ignore()
     
@@ -166,44 +230,57 @@ class FileSelector(QWidget):
             if url.isLocalFile():
                 filepath = url.toLocalFile()
                 if is_supported_format(filepath):
-                    self._set_file(filepath)
-                    event.acceptProposedAction()
-                    return
+                    if self._set_file(filepath):
+                        event.acceptProposedAction()
+                        return
+                    # Report after the drop returns so the drag source isn't left waiting
+                    QTimer.singleShot(0, lambda: self._show_rejected(filepath))
         event.ignore()
     
     def _reset_drop_zone_style(self):
         """Reset drop zone to default style."""
-        self.drop_zone.setStyleSheet("""
-            #dropZone {
-                border: 2px dashed #4a4a4a;
-                border-radius: 12px;
-                background-color: rgba(99, 102, 241, 0.05);
-                min-height: 180px;
-            }
-            #dropZone:hover {
-                border-color: #6366f1;
-                background-color: rgba(99, 102, 241, 0.1);
-            }
-        """)
+        self._set_drag_active(False)
+    
+    def _set_drag_active(self, active: bool):
+        """Toggle the drop zone's drag-hover highlight."""
+        _set_style_property(self.drop_zone, "dragActive", active)
     
     def _browse_files(self):
         """Open file browser dialog."""
-        formats = ' '.join(f'*{ext}' for ext in SUPPORTED_FORMATS)
-        filepath, _ = QFileDialog.getOpenFileName(
-            self,
-            "Select Audio or Video File",
-            "",
-            f"Media Files ({formats});;All Files (*)"
+        formats = ' '.join(f'*{ext}' for ext in sorted(SUPPORTED_FORMATS))
+        
+        # Explicit dialog so we can skip per-file icon and symlink resolution,
+        # which makes the static helper very slow on large or network folders
+        dialog = QFileDialog(self, "Select Audio or Video File")
+        dialog.setOptions(
+            QFileDialog.Option.DontUseCustomDirectoryIcons
+            | QFileDialog.Option.DontResolveSymlinks
+            | QFileDialog.Option.ReadOnly
         )
-        if filepath:
-            self._set_file(filepath)
+        dialog.setFileMode(QFileDialog.FileMode.ExistingFile)
+        dialog.setNameFilters([f"Media Files ({formats})", "All Files (*)"])
+        
+        accepted = dialog.exec()
+        files = dialog.selectedFiles()
+        dialog.deleteLater()  # Parented to self, so it would otherwise live as long as the widget
+        
+        if accepted and files:
+            filepath = files[0]
+            if not self._set_file(filepath):
+                self._show_rejected(filepath)
     
+    def _show_rejected(self, filepath: str):
+        """Tell the user why a chosen file was not selected."""
+        QMessageBox.warning(
+            self, "Unsupported File",
+            f"{os.path.basename(filepath)} is not a readable audio or video file."
+        )
 
-    def _set_file(self, filepath: str):
-        """Set the selected file."""
-        # Verify file exists
-        if not os.path.isfile(filepath):
-            return
+    def _set_file(self, filepath: str) -> bool:
+        """Set the selected file. Returns False if it was rejected."""
+        # Verify file exists and really is audio/video, not just named like it
+        if not os.path.isfile(filepath) or not has_media_signature(filepath):
+            return False
         
         self.selected_file = filepath
         
@@ -211,22 +288,30 @@ class FileSelector(QWidget):
         filename = os.path.basename(filepath)
         self.file_name_label.setText(filename)
         
-        # Get duration if possible
-        duration = get_audio_duration(filepath)
-        if duration:
-            self.file_duration_label.setText(format_duration(duration))
-        else:
-            self.file_duration_label.setText("")
+        # Get duration in the background; ffprobe can take a while
+        self.file_duration_label.setText("…")
+        worker = DurationProbeWorker(filepath)
+        worker.probed.connect(self._on_duration_probed)
+        worker.finished.connect(lambda: self._duration_workers.discard(worker))
+        self._duration_workers.add(worker)
+        worker.start()
         
         # Show file info, update drop zone with success state
         self.file_info.setVisible(True)
         self.icon_label.set_icon('check_circle')
         self.icon_label.set_color(IconColors.SUCCESS)
         self.text_label.setText("File ready for transcription")
-        self.text_label.setStyleSheet("color: #22c55e; font-size: 14px;")
+        _set_style_property(self.text_label, "fileSelected", True)
         
         # Emit signal
         self.file_selected.emit(filepath)
+        return True
+    
+    def _on_duration_probed(self, filepath: str, duration):
+        """Show a probed duration if its file is still the selected one."""
+        if filepath != self.selected_file:
+            return
+        self.file_duration_label.setText(format_duration(duration) if duration else "")
     
     def _clear_selection(self):
         """Clear the current selection."""
@@ -235,7 +320,12 @@ class FileSelector(QWidget):
         self.icon_label.set_icon('music')
         self.icon_label.set_color(IconColors.DEFAULT)
         self.text_label.setText("Drop audio or video file here")
-        self.text_label.setStyleSheet("color: #888; font-size: 14px;")
+        _set_style_property(self.text_label, "fileSelected", False)
+    
+    def cleanup(self):
+        """Wait for running duration probes before the widget goes away."""
+        for worker in list(self._duration_workers):
+            worker.wait()
     
     def get_file(self) -> str | None:
         """Get the currently selected file path."""
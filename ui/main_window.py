@@ -10,6 +10,7 @@ from PyQt6.QtWidgets import (
     QApplication, QComboBox, QCheckBox, QTabWidget
 )
 from PyQt6.QtCore import Qt, QSize, QThread, pyqtSignal
+from PyQt6.QtGui import QStandardItemModel, QStandardItem
 
 from ui.file_selector import FileSelector
 from ui.transcript_view import TranscriptView
@@ -23,6 +24,52 @@ from utils import WHISPER_MODELS, WHISPER_LANGUAGES, PERFORMANCE_MODES, detect_g
 from config import get_config
 
 
+# Stylesheets are built once at import and applied to the parent container,
+# matched by objectName, so Qt parses them once instead of once per widget.
+HEADER_COMBO_QSS = """
+QComboBox#headerCombo {
+    padding: 6px 10px;
+    padding-right: 25px;
+    border: 1px solid #3a3a3a;
+    border-radius: 6px;
+    background-color: #2a2a2a;
+    color: #e0e0e0;
+    font-size: 12px;
+}
+QComboBox#headerCombo:hover {
+    border-color: #5a5a5a;
+}
+QComboBox#headerCombo::drop-down {
+    subcontrol-origin: padding;
+    subcontrol-position: center right;
+    width: 18px;
+    border: none;
+    background: transparent;
+}
+QComboBox#headerCombo::down-arrow {
+    width: 0;
+    height: 0;
+    border-left: 4px solid transparent;
+    border-right: 4px solid transparent;
+    border-top: 4px solid #888;
+}
+QComboBox#headerCombo QAbstractItemView {
+    background-color: #2a2a2a;
+    border: 1px solid #3a3a3a;
+    selection-background-color: #6366f1;
+    color: #e0e0e0;
+    outline: none;
+}
+"""
+
+EXPORT_CHECKBOX_QSS = """
+QCheckBox#exportFormat { color: #aaa; font-size: 11px; }
+QCheckBox#exportFormat:checked { color: #e0e0e0; }
+QCheckBox#exportFormat::indicator { width: 14px; height: 14px; border: 1px solid #4a4a4a; border-radius: 3px; background: #2a2a2a; }
+QCheckBox#exportFormat::indicator:checked { background: #6366f1; border-color: #6366f1; }
+"""
+
+
 # ============================================================================
 # BACKGROUND WORKER FOR AI PROCESSING
 # ============================================================================
@@ -100,6 +147,19 @@ class AIProcessingWorker(QThread):
             self.finished.emit(result)
 
 
+class GpuDetectWorker(QThread):
+    """Runs GPU detection (nvidia-smi / rocminfo / sysctl) off the GUI thread."""
+    
+    detected = pyqtSignal(str, str)  # gpu_type, description
+    
+    def __init__(self, transcriber: Transcriber):
+        super().__init__()
+        self._transcriber = transcriber
+    
+    def run(self):
+        self.detected.emit(*self._transcriber.gpu_info)
+
+
 # ============================================================================
 # MAIN WINDOW
 # ============================================================================
@@ -115,9 +175,14 @@ class MainWindow(QMainWindow):
         self._ai_worker: AIProcessingWorker | None = None
         # Device toggle: True = use GPU (if available), False = force CPU
         self._use_gpu = True
-        self._gpu_type, self._gpu_name = self.transcriber.gpu_type, self.transcriber.gpu_name
+        # Shown as CPU until background GPU detection reports back
+        self._gpu_type, self._gpu_name = 'cpu', "CPU"
         self._setup_ui()
         self._connect_signals()
+        
+        self._gpu_worker = GpuDetectWorker(self.transcriber)
+        self._gpu_worker.detected.connect(self._on_gpu_detected)
+        self._gpu_worker.start()
     
     def closeEvent(self, event):
         """Handle window close - cleanup resources."""
@@ -125,6 +190,12 @@ class MainWindow(QMainWindow):
         if self.transcriber.is_busy():
             self.transcriber.cancel()
         
+        if self._gpu_worker.isRunning():
+            self._gpu_worker.wait()
+        
+        # Running ffprobe duration lookups must finish before their threads go
+        self.file_selector.cleanup()
+        
         # Stop AI worker if running
         if self._ai_worker and self._ai_worker.isRunning():
             self._ai_worker.cancel()
@@ -134,6 +205,10 @@ class MainWindow(QMainWindow):
         if hasattr(self, 'ai_panel'):
             self.ai_panel.cleanup()
         
+        # Let in-flight article exports finish writing their files
+        if hasattr(self, 'article_view'):
+            self.article_view.cleanup()
+        
         # Cleanup batch processing
         if hasattr(self, 'batch_panel') and self.batch_panel.processor.is_processing:
             self.batch_panel.cancel_processing()
@@ -142,50 +217,33 @@ class MainWindow(QMainWindow):
     
     
     def _create_header_combo(self, items: list, width: int = 150) -> QComboBox:
-        """Create a compact combo box for the header bar."""
+        """Create a compact combo box for the header bar (styled by the header's QSS)."""
         combo = QComboBox()
         combo.setFixedWidth(width)
-        combo.setStyleSheet("""
-            QComboBox {
-                padding: 6px 10px;
-                padding-right: 25px;
-                border: 1px solid #3a3a3a;
-                border-radius: 6px;
-                background-color: #2a2a2a;
-                color: #e0e0e0;
-                font-size: 12px;
-            }
-            QComboBox:hover {
-                border-color: #5a5a5a;
-            }
-            QComboBox::drop-down {
-                subcontrol-origin: padding;
-                subcontrol-position: center right;
-                width: 18px;
-                border: none;
-                background: transparent;
-            }
-            QComboBox::down-arrow {
-                width: 0;
-                height: 0;
-                border-left: 4px solid transparent;
-                border-right: 4px solid transparent;
-                border-top: 4px solid #888;
-            }
-            QComboBox QAbstractItemView {
-                background-color: #2a2a2a;
-                border: 1px solid #3a3a3a;
-                selection-background-color: #6366f1;
-                color: #e0e0e0;
-                outline: none;
-            }
-        """)
+        combo.setObjectName("headerCombo")  # Styled by HEADER_COMBO_QSS
+        combo.setModel(self._build_combo_model(items, combo))
+        return combo
+    
+    @staticmethod
+    def _build_combo_model(items: list, parent: QComboBox) -> QStandardItemModel:
+        """
+        Build a combo model in one pass from (data, label) tuples or plain labels.
+        
+        Items are added to the detached model in one appendColumn call, which
+        avoids a Qt round-trip per addItem() on long lists such as the
+        languages.
+        """
+        model = QStandardItemModel(parent)
+        column = []
         for item in items:
             if isinstance(item, tuple):
-                combo.addItem(item[1], item[0])
+                std_item = QStandardItem(item[1])
+                std_item.setData(item[0], Qt.ItemDataRole.UserRole)
             else:
-                combo.addItem(item)
-        return combo
+                std_item = QStandardItem(item)
+            column.append(std_item)
+        model.appendColumn(column)
+        return model
     
     def _setup_ui(self):
         """Set up the main window UI with header-bar layout."""
@@ -202,6 +260,7 @@ class MainWindow(QMainWindow):
         
         # ===== Header Bar with Settings =====
         header = QWidget()
+        header.setStyleSheet(HEADER_COMBO_QSS)
         header_layout = QHBoxLayout(header)
         header_layout.setContentsMargins(0, 0, 0, 0)
         header_layout.setSpacing(16)
@@ -287,6 +346,7 @@ class MainWindow(QMainWindow):
         
         # Left: File selector and AI Panel
         left_panel = QWidget()
+        left_panel.setStyleSheet(EXPORT_CHECKBOX_QSS)
         left_layout = QVBoxLayout(left_panel)
         left_layout.setContentsMargins(0, 0, 12, 0)
         left_layout.setSpacing(12)
@@ -299,28 +359,21 @@ class MainWindow(QMainWindow):
         export_label.setStyleSheet("color: #888; font-size: 12px; font-weight: bold; margin-top: 8px;")
         left_layout.addWidget(export_label)
         
-        checkbox_style = """
-            QCheckBox { color: #aaa; font-size: 11px; }
-            QCheckBox:checked { color: #e0e0e0; }
-            QCheckBox::indicator { width: 14px; height: 14px; border: 1px solid #4a4a4a; border-radius: 3px; background: #2a2a2a; }
-            QCheckBox::indicator:checked { background: #6366f1; border-color: #6366f1; }
-        """
-        
         self.format_txt = QCheckBox("Plain Text (.txt)")
-        self.format_txt.setStyleSheet(checkbox_style)
+        self.format_txt.setObjectName("exportFormat")
         self.format_txt.setChecked(True)
         left_layout.addWidget(self.format_txt)
         
         self.format_srt = QCheckBox("SRT (.srt)")
-        self.format_srt.setStyleSheet(checkbox_style)
+        self.format_srt.setObjectName("exportFormat")
         left_layout.addWidget(self.format_srt)
         
         self.format_vtt = QCheckBox("WebVTT (.vtt)")
-        self.format_vtt.setStyleSheet(checkbox_style)
+        self.format_vtt.setObjectName("exportFormat")
         left_layout.addWidget(self.format_vtt)
         
         self.format_json = QCheckBox("JSON (.json)")
-        self.format_json.setStyleSheet(checkbox_style)
+        self.format_json.setObjectName("exportFormat")
         left_layout.addWidget(self.format_json)
         
         # AI Processing Panel
@@ -459,6 +512,11 @@ class MainWindow(QMainWindow):
         self.article_view.export_done.connect(lambda msg: self.status_label.setText(msg))
         self.cleaned_view.copy_requested.connect(lambda: self.status_label.setText("Copied to clipboard"))
     
+    def _on_gpu_detected(self, gpu_type: str, gpu_name: str):
+        """Apply the background GPU detection result."""
+        self._gpu_type, self._gpu_name = gpu_type, gpu_name
+        self._update_device_badge()
+    
     def _toggle_device(self):
         """Toggle between GPU and CPU mode."""
         if self._gpu_type == 'cpu':
@@ -155,6 +155,7 @@ class TranscriptView(QWidget):
         # Text display
         self.text_edit = QTextEdit()
         self.text_edit.setReadOnly(True)
+        self.text_edit.setUndoRedoEnabled(False)
         self.text_edit.setFont(QFont("Monospace", 11))
         self.text_edit.setStyleSheet("""
             QTextEdit {
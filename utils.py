@@ -10,20 +10,51 @@ from typing import Optional, Tuple
 
 
 # Supported audio/video formats
-SUPPORTED_FORMATS = {
+SUPPORTED_FORMATS = frozenset({
     # Audio
     '.mp3', '.wav', '.flac', '.m4a', '.ogg', '.opus', '.wma', '.aac',
     # Video
     '.mp4', '.mkv', '.avi', '.mov', '.webm', '.wmv', '.flv', '.m4v'
-}
+})
+
+# Leading bytes of the container formats above
+_MEDIA_MAGIC_PREFIXES = (
+    b'ID3',                           # MP3 / AAC with ID3 tag
+    b'fLaC',                          # FLAC
+    b'OggS',                          # OGG, Opus
+    b'\x1a\x45\xdf\xa3',              # Matroska, WebM
+    b'\x30\x26\xb2\x75\x8e\x66\xcf\x11',  # ASF (WMA, WMV)
+    b'FLV',                           # Flash video
+)
+# RIFF is a generic container (also WebP, CDR, ...): check the form type at offset 8
+_RIFF_MAGIC = (b'RIFF', b'RF64')
+_RIFF_MEDIA_FORMS = (b'WAVE', b'AVI ')
+# ISO base media (MP4, M4A, M4V, MOV): box type at offset 4
+_ISO_BOX_TYPES = (b'ftyp', b'moov', b'mdat', b'free', b'skip', b'wide', b'pnot')
 
 
 def is_supported_format(filepath: str) -> bool:
-    """Check if the file format is supported."""
+    """Check if the file format is supported (by extension only, no I/O)."""
     ext = os.path.splitext(filepath)[1].lower()
     return ext in SUPPORTED_FORMATS
 
 
+def has_media_signature(filepath: str) -> bool:
+    """Check the file's leading bytes for a known audio/video container."""
+    try:
+        with open(filepath, 'rb') as f:
+            header = f.read(16)
+    except OSError:
+        return False
+    
+    if header.startswith(_MEDIA_MAGIC_PREFIXES) or header[4:8] in _ISO_BOX_TYPES:
+        return True
+    if header.startswith(_RIFF_MAGIC):
+        return header[8:12] in _RIFF_MEDIA_FORMS
+    # Raw MPEG audio (MP3 / ADTS AAC) starts with an 11/12-bit frame sync
+    return len(header) >= 2 and header[0] == 0xFF and (header[1] & 0xE0) == 0xE0
+
+
 def get_file_extension(filepath: str) -> str:
     """Get the lowercase file extension."""
     return os.path.splitext(filepath)[1].lower()
@@ -6,7 +6,7 @@ Automates the pipeline:
   Zoom recordings → Whisper transcription → LM Studio topic extraction → Blog-ready content
 
 Usage:
-  python zoom_to_blog.py /path/to/zoom_recording.mp4 [options]
+  python zoom_to_blog.py /path/to/zoom_recording.mp4 [more recordings...] [options]
 
 Requirements:
   - ffmpeg (for audio extraction)
@@ -17,14 +17,16 @@ Requirements:
 import os
 import sys
 import json
+import hashlib
 import argparse
+import shutil
+import string
 import subprocess
 import tempfile
+import threading
 from datetime import datetime
 from pathlib import Path
-from typing import Optional
-import urllib.request
-import urllib.error
+from typing import Callable, Optional
 
 
 # ============================================================================
@@ -42,11 +44,31 @@ WHISPER_MODELS = {
     "base.en": "ggml-base.en.bin",
 }
 
+# Friendly name -> full model path, joined once at import
+_MODEL_PATHS = {
+    name: os.path.join(WHISPER_CPP_MODELS_DIR, filename)
+    for name, filename in WHISPER_MODELS.items()
+}
+
 DEFAULT_WHISPER_MODEL = "turbo"
 DEFAULT_LM_STUDIO_URL = "http://localhost:1234/v1"
 DEFAULT_OUTPUT_DIR = "./output"
 DEFAULT_LANGUAGE = "auto"
 
+# Social snippets are written from the start of the blog post only
+SNIPPET_SOURCE_CHARS = 4000
+
+# Transcripts are cached per input file + model + language, so re-running a
+# recording (e.g. to regenerate the blog) skips audio extraction and Whisper
+TRANSCRIPTION_CACHE_DIR = os.path.expanduser("~/.cache/whisper_fedora/transcriptions")
+
+# ffprobe results per input file, so repeated runs on a WAV skip the probe
+AUDIO_PARAMS_CACHE_FILE = os.path.expanduser("~/.cache/whisper_fedora/audio_params.json")
+MAX_AUDIO_PARAMS_ENTRIES = 500
+
+# Batch runs extract audio for this many recordings at once
+AUDIO_PREP_WORKERS = 2
+
 
 # Blog generation prompts
 TOPIC_EXTRACTION_PROMPT = """Analyze this transcription from a recorded session and extract:
@@ -92,6 +114,35 @@ Blog content:
 Format as a numbered list."""
 
 
+def _compile_prompt(template: str) -> Callable[..., str]:
+    """
+    Parse a str.format template once into literal text and field names.
+    
+    The returned function fills the fields by joining the pieces, without
+    reparsing the (multi-KB) template on every call.
+    """
+    pieces: list[str] = []
+    fields: list[tuple[int, str]] = []  # (index in pieces, field name)
+    for literal, field, _, _ in string.Formatter().parse(template):
+        pieces.append(literal)
+        if field is not None:
+            fields.append((len(pieces), field))
+            pieces.append("")
+    
+    def render(**values: str) -> str:
+        parts = pieces.copy()
+        for index, field in fields:
+            parts[index] = str(values[field])
+        return "".join(parts)
+    
+    return render
+
+
+_render_topic_prompt = _compile_prompt(TOPIC_EXTRACTION_PROMPT)
+_render_blog_prompt = _compile_prompt(BLOG_GENERATION_PROMPT)
+_render_snippets_prompt = _compile_prompt(SOCIAL_SNIPPETS_PROMPT)
+
+
 # ============================================================================
 # AUDIO EXTRACTION
 # ============================================================================
@@ -127,27 +178,133 @@ def extract_audio(input_file: str, output_wav: str) -> bool:
         return False
 
 
+# Audio format whisper.cpp wants; inputs already in it need no re-encode
+WHISPER_AUDIO_PARAMS = (16000, 1, "pcm_s16le")
+
+
+def get_audio_params(input_file: str) -> Optional[tuple[int, int, str]]:
+    """Probe (sample_rate, channels, codec) of the first audio stream with ffprobe."""
+    cmd = [
+        "ffprobe", "-v", "error",
+        "-select_streams", "a:0",
+        "-show_entries", "stream=sample_rate,channels,codec_name",
+        "-of", "json",
+        input_file
+    ]
+    
+    try:
+        result = subprocess.run(cmd, capture_output=True, text=True, check=True, timeout=30)
+        stream = json.loads(result.stdout)["streams"][0]
+        return (int(stream["sample_rate"]), int(stream["channels"]), stream["codec_name"])
+    except (subprocess.SubprocessError, FileNotFoundError, KeyError, IndexError, ValueError):
+        return None
+
+
+def file_fingerprint(input_file: Path) -> str:
+    """Identify a file by its path, size and mtime (without reading it)."""
+    st = input_file.stat()
+    identity = f"{input_file.resolve()}|{st.st_size}|{st.st_mtime_ns}"
+    return hashlib.sha256(identity.encode('utf-8')).hexdigest()[:32]
+
+
+_audio_params_cache: Optional[dict[str, list]] = None
+_audio_params_lock = threading.Lock()  # Batch runs probe from several threads
+
+
+def _get_audio_params_cache() -> dict[str, list]:
+    """Load the on-disk audio params cache once per process."""
+    global _audio_params_cache
+    if _audio_params_cache is None:
+        try:
+            with open(AUDIO_PARAMS_CACHE_FILE, 'r', encoding='utf-8') as f:
+                _audio_params_cache = json.load(f)
+        except (OSError, ValueError):
+            _audio_params_cache = {}
+        if not isinstance(_audio_params_cache, dict):
+            _audio_params_cache = {}  # Foreign or corrupt file: start over
+    return _audio_params_cache
+
+
+def _is_audio_params_entry(entry) -> bool:
+    """Whether a cache entry has the [sample_rate, channels, codec] shape."""
+    if not isinstance(entry, list) or len(entry) != 3:
+        return False
+    sample_rate, channels, codec = entry
+    return (
+        type(sample_rate) is int and type(channels) is int and isinstance(codec, str)
+    )
+
+
+def _save_audio_params_cache(cache: dict[str, list]) -> None:
+    """Write the audio params cache atomically (best effort)."""
+    try:
+        os.makedirs(os.path.dirname(AUDIO_PARAMS_CACHE_FILE), exist_ok=True)
+        tmp_file = AUDIO_PARAMS_CACHE_FILE + ".tmp"
+        with open(tmp_file, 'w', encoding='utf-8') as f:
+            json.dump(cache, f)
+        os.replace(tmp_file, AUDIO_PARAMS_CACHE_FILE)
+    except OSError:
+        pass
+
+
+def get_cached_audio_params(input_file: Path) -> Optional[tuple[int, int, str]]:
+    """get_audio_params, cached on disk by the file's fingerprint."""
+    try:
+        key = file_fingerprint(input_file)
+    except OSError:
+        return get_audio_params(str(input_file))
+    
+    with _audio_params_lock:
+        cache = _get_audio_params_cache()
+        entry = cache.get(key)
+        if _is_audio_params_entry(entry):
+            return tuple(entry)
+    
+    params = get_audio_params(str(input_file))
+    if params is not None:  # Failed probes (e.g. no ffprobe) aren't cached
+        with _audio_params_lock:
+            cache[key] = list(params)
+            while len(cache) > MAX_AUDIO_PARAMS_ENTRIES:
+                del cache[next(iter(cache))]  # Oldest entry first
+            _save_audio_params_cache(cache)
+    return params
+
+
 # ============================================================================
 # WHISPER TRANSCRIPTION (whisper.cpp)
 # ============================================================================
 
 def get_model_path(model_name: str) -> str:
     """Get full path to whisper model file."""
-    if model_name in WHISPER_MODELS:
-        return os.path.join(WHISPER_CPP_MODELS_DIR, WHISPER_MODELS[model_name])
-    # Allow direct model filename
+    if model_name in _MODEL_PATHS:
+        return _MODEL_PATHS[model_name]
+    # A path to a model file (relative to the current directory)...
+    path = os.path.expanduser(model_name)
+    if os.path.isfile(path):
+        return os.path.abspath(path)
+    # ...or a ggml filename in the models dir
     return os.path.join(WHISPER_CPP_MODELS_DIR, model_name)
 
 
-def transcribe_audio(
-    audio_file: str,
-    output_dir: str,
-    model: str = DEFAULT_WHISPER_MODEL,
-    language: str = DEFAULT_LANGUAGE
-) -> Optional[str]:
-    """Transcribe audio using whisper.cpp (fast, with Metal GPU acceleration)."""
-    
+def is_known_model(model_name: str) -> bool:
+    """Whether the model is a configured name or an existing ggml model file."""
+    return model_name in WHISPER_MODELS or os.path.isfile(get_model_path(model_name))
+
+
+def _report_unknown_model(model_name: str) -> None:
+    print(f"❌ Unknown whisper model: {model_name}")
+    print(f"   Use one of: {', '.join(WHISPER_MODELS)}, or a ggml model file")
+
+
+# Models whose setup has been verified; later runs skip the filesystem checks
+_verified_models: set[str] = set()
+
+
+def check_whisper_setup(model: str) -> Optional[str]:
+    """Return the model path if whisper.cpp and the model are installed."""
     model_path = get_model_path(model)
+    if model in _verified_models:
+        return model_path
     
     if not os.path.exists(WHISPER_CPP_BIN):
         print(f"❌ whisper.cpp not found at: {WHISPER_CPP_BIN}")
@@ -158,50 +315,81 @@ def transcribe_audio(
         print(f"❌ Model not found: {model_path}")
         print(f"   Available models in {WHISPER_CPP_MODELS_DIR}:")
         for name, filename in WHISPER_MODELS.items():
-            full_path = os.path.join(WHISPER_CPP_MODELS_DIR, filename)
-            status = "✓" if os.path.exists(full_path) else "✗"
+            status = "✓" if os.path.exists(_MODEL_PATHS[name]) else "✗"
             print(f"     {status} {name} -> {filename}")
         return None
     
-    print(f"🎤 Transcribing with whisper.cpp (model: {model})...")
-    print(f"   Using Metal GPU acceleration")
+    _verified_models.add(model)
+    return model_path
+
+
+def _whisper_command(
+    model_path: str,
+    inputs: list[tuple[str, str]],
+    language: str
+) -> list[str]:
+    """
+    whisper.cpp command line for (audio file, output base) pairs.
     
-    # Build output file path (whisper.cpp adds extension automatically)
-    output_base = os.path.join(output_dir, "transcription")
-    
-    cmd = [
-        WHISPER_CPP_BIN,
-        "-m", model_path,
-        "-f", audio_file,
-        "-of", output_base,  # Output file (without extension)
-        "-otxt",             # Output as .txt
-        "-np",               # No prints (cleaner output)
-    ]
+    Each input's transcript is written to <output base>.txt, one segment per
+    line. (Its stdout can't be used instead: with -nt all segments are
+    printed on a single line.)
+    """
+    cmd = [WHISPER_CPP_BIN, "-m", model_path, "-otxt", "-np"]
+    for audio_file, out_base in inputs:
+        cmd.extend(["-f", audio_file, "-of", out_base])  # "-f -" reads a WAV from stdin
     
     if language != "auto":
         cmd.extend(["-l", language])
+    return cmd
+
+
+def _whisper_output_file(out_base: str) -> Optional[str]:
+    """Path of the non-empty transcript whisper.cpp wrote for one input, if any."""
+    txt_file = out_base + ".txt"
+    try:
+        return txt_file if os.path.getsize(txt_file) > 0 else None
+    except OSError:
+        return None
+
+
+def transcribe_audio(
+    audio_file: str,
+    output_dir: str,
+    model: str = DEFAULT_WHISPER_MODEL,
+    language: str = DEFAULT_LANGUAGE
+) -> Optional[str]:
+    """
+    Transcribe audio using whisper.cpp (fast, with Metal GPU acceleration).
     
+    Returns the path of the transcript file whisper.cpp wrote in output_dir;
+    the text itself is never read here.
+    """
+    
+    model_path = check_whisper_setup(model)
+    if not model_path:
+        return None
+    
+    print(f"🎤 Transcribing with whisper.cpp (model: {model})...")
+    print(f"   Using Metal GPU acceleration")
+    
+    out_base = os.path.join(output_dir, "whisper_output")
     try:
         result = subprocess.run(
-            cmd,
-            capture_output=True,
+            _whisper_command(model_path, [(audio_file, out_base)], language),
+            stdout=subprocess.DEVNULL,
+            stderr=subprocess.PIPE,
             text=True,
             check=True
         )
+        transcript_file = _whisper_output_file(out_base)
         
-        # Read the output txt file
-        txt_file = f"{output_base}.txt"
-        
-        if os.path.exists(txt_file):
-            with open(txt_file, 'r', encoding='utf-8') as f:
-                transcription = f.read().strip()
-            print(f"✅ Transcription complete: {len(transcription)} characters")
-            return transcription
+        if transcript_file:
+            print(f"✅ Transcription complete: {os.path.getsize(transcript_file)} bytes")
+            return transcript_file
         else:
-            print(f"❌ Transcription file not found: {txt_file}")
+            print("❌ whisper.cpp produced no transcription")
             # Show any output for debugging
-            if result.stdout:
-                print(f"   stdout: {result.stdout[:500]}")
             if result.stderr:
                 print(f"   stderr: {result.stderr[:500]}")
             return None
@@ -216,44 +404,264 @@ def transcribe_audio(
         return None
 
 
+def transcribe_media(
+    input_file: str,
+    output_dir: str,
+    model: str = DEFAULT_WHISPER_MODEL,
+    language: str = DEFAULT_LANGUAGE
+) -> Optional[str]:
+    """
+    Transcribe any audio/video file by piping ffmpeg's 16kHz WAV output into
+    whisper.cpp, so the converted audio is never written to disk.
+    
+    Returns the path of the transcript file whisper.cpp wrote in output_dir.
+    """
+    model_path = check_whisper_setup(model)
+    if not model_path:
+        return None
+    
+    print(f"📼 Streaming audio from: {input_file}")
+    print(f"🎤 Transcribing with whisper.cpp (model: {model})...")
+    
+    ffmpeg_cmd = [
+        "ffmpeg", "-nostdin",
+        "-v", "error",
+        "-i", input_file,
+        "-vn",  # No video
+        "-acodec", "pcm_s16le",  # 16-bit PCM
+        "-ar", "16000",  # 16kHz sample rate
+        "-ac", "1",  # Mono
+        "-f", "wav", "pipe:1"
+    ]
+    
+    # ffmpeg's errors go to a file: a pipe that is only read after whisper.cpp
+    # exits can fill up, stalling ffmpeg and with it whisper.cpp
+    with tempfile.TemporaryFile() as ffmpeg_log:
+        try:
+            ffmpeg = subprocess.Popen(ffmpeg_cmd, stdout=subprocess.PIPE, stderr=ffmpeg_log)
+        except FileNotFoundError:
+            print("❌ ffmpeg not found. Please install it: brew install ffmpeg")
+            return None
+        
+        out_base = os.path.join(output_dir, "whisper_output")
+        whisper = None
+        try:
+            try:
+                whisper = subprocess.Popen(
+                    _whisper_command(model_path, [("-", out_base)], language),
+                    stdin=ffmpeg.stdout,
+                    stdout=subprocess.DEVNULL,
+                    stderr=subprocess.PIPE,
+                    text=True
+                )
+            finally:
+                ffmpeg.stdout.close()  # Only whisper.cpp reads the pipe now
+            _, stderr = whisper.communicate()
+        except Exception as e:
+            print(f"❌ Error running whisper.cpp: {e}")
+            return None
+        finally:
+            # Once whisper.cpp has exited ffmpeg stops on the broken pipe;
+            # otherwise (failed start, interrupt) don't leave either running
+            if whisper is None or whisper.returncode is None:
+                ffmpeg.kill()
+                if whisper is not None:
+                    whisper.kill()
+                    whisper.wait()
+            ffmpeg.wait()
+        
+        transcript_file = _whisper_output_file(out_base)
+        ffmpeg_log.seek(0)
+        ffmpeg_errors = ffmpeg_log.read().decode('utf-8', errors='replace')
+    
+    # A whisper.cpp failure also breaks ffmpeg's pipe, so report it first
+    if whisper.returncode != 0:
+        print(f"❌ Transcription failed:")
+        if stderr:
+            print(f"   {stderr[:500]}")
+        if ffmpeg_errors:
+            print(f"   ffmpeg: {ffmpeg_errors[:500]}")
+        return None
+    if ffmpeg.returncode != 0:
+        print(f"❌ Failed to extract audio: {ffmpeg_errors[:500]}")
+        return None
+    
+    if not transcript_file:
+        print("❌ whisper.cpp produced no transcription")
+        return None
+    
+    print(f"✅ Transcription complete: {os.path.getsize(transcript_file)} bytes")
+    return transcript_file
+
+
+def transcribe_audio_batch(
+    audio_files: list[str],
+    output_dir: str,
+    model: str = DEFAULT_WHISPER_MODEL,
+    language: str = DEFAULT_LANGUAGE
+) -> dict[str, Optional[str]]:
+    """
+    Transcribe several audio files with a single whisper.cpp run.
+    
+    The model is loaded once for all files. Returns the path of the
+    transcript file written in output_dir (or None on failure) per input.
+    """
+    results: dict[str, Optional[str]] = {path: None for path in audio_files}
+    if not audio_files:
+        return results
+    
+    model_path = check_whisper_setup(model)
+    if not model_path:
+        return results
+    
+    print(f"🎤 Transcribing {len(audio_files)} files with whisper.cpp (model: {model})...")
+    
+    # One -f/-of pair per file: whisper.cpp writes <of>.txt for each input
+    out_bases = [
+        os.path.join(output_dir, f"whisper_output_{i}") for i in range(len(audio_files))
+    ]
+    cmd = _whisper_command(model_path, list(zip(audio_files, out_bases)), language)
+    
+    try:
+        result = subprocess.run(
+            cmd, stdout=subprocess.DEVNULL, stderr=subprocess.PIPE, text=True
+        )
+    except Exception as e:
+        print(f"❌ Error running whisper.cpp: {e}")
+        return results
+    
+    # Files finished before a failure still have their transcript
+    for audio_file, out_base in zip(audio_files, out_bases):
+        results[audio_file] = _whisper_output_file(out_base)
+    
+    if result.returncode != 0 and result.stderr:
+        print(f"❌ whisper.cpp exited with code {result.returncode}:")
+        print(f"   {result.stderr[:500]}")
+    
+    done = sum(1 for path in results.values() if path)
+    print(f"✅ Transcribed {done}/{len(audio_files)} files")
+    return results
+
+
+def get_transcription_cache_path(input_file: Path, model: str, language: str) -> Path:
+    """Cache file for a transcript, keyed by the input's path, size and mtime."""
+    digest = file_fingerprint(input_file)
+    model_tag = model.replace(os.sep, '_')  # Model may be given as a file path
+    return Path(TRANSCRIPTION_CACHE_DIR) / f"{digest}_{model_tag}_{language}.txt"
+
+
+def load_cached_transcription(cache_file: Path) -> Optional[str]:
+    """Return a cached transcript, or None if there is none."""
+    try:
+        with open(cache_file, 'r', encoding='utf-8') as f:
+            return f.read().strip() or None
+    except OSError:
+        return None
+
+
+def _has_transcript(path: Path) -> bool:
+    """Whether a non-empty transcript file exists at path."""
+    try:
+        return path.stat().st_size > 0
+    except OSError:
+        return False
+
+
+def _copy_cached_transcription(cache_file: Path, dest: Path) -> bool:
+    """Copy a non-empty cached transcript to dest (sendfile on Linux)."""
+    if not _has_transcript(cache_file):
+        return False
+    try:
+        shutil.copyfile(cache_file, dest)
+        return True
+    except OSError:
+        return False
+
+
+def _move_transcript(transcript_file: str, dest: Path) -> bool:
+    """Move a non-empty transcript file to dest (a rename on the same filesystem)."""
+    if not _has_transcript(Path(transcript_file)):
+        return False
+    try:
+        shutil.move(transcript_file, dest)
+        return True
+    except OSError:
+        return False
+
+
+def save_cached_transcription(cache_file: Path, transcript_file: str) -> None:
+    """Copy a transcript file into the cache (best effort, sendfile on Linux)."""
+    try:
+        cache_file.parent.mkdir(parents=True, exist_ok=True)
+        tmp_file = cache_file.with_suffix('.tmp')
+        shutil.copyfile(transcript_file, tmp_file)
+        os.replace(tmp_file, cache_file)  # Never leave a half-written cache entry
+    except OSError as e:
+        print(f"⚠️  Could not cache transcription: {e}")
+
 
 # ============================================================================
 # LM STUDIO API
 # ============================================================================
 
+# One client per server URL, shared by all threads and files of a run so
+# requests reuse its pooled keep-alive connections. text_processor (and with
+# it http.client, which pulls in ssl and email) is imported on first use, so
+# transcription-only runs never load it.
+_lm_clients: dict[str, 'LMStudioClient'] = {}
+_lm_clients_lock = threading.Lock()
+
+
+def _get_lm_client(lm_studio_url: str) -> 'LMStudioClient':
+    """Get the shared LM Studio client for a server URL (lazy created)."""
+    from text_processor import LMStudioClient
+    
+    with _lm_clients_lock:
+        client = _lm_clients.get(lm_studio_url)
+        if client is None:
+            client = LMStudioClient(lm_studio_url)
+            _lm_clients[lm_studio_url] = client
+        return client
+
+
+class LMRequestCancelled(Exception):
+    """Raised from an on_chunk callback to abandon a streaming request."""
+
+
 def call_lm_studio(
     prompt: str,
     lm_studio_url: str = DEFAULT_LM_STUDIO_URL,
-    max_tokens: int = 4096
+    max_tokens: int = 4096,
+    on_chunk: Optional[Callable[[str], None]] = None
 ) -> Optional[str]:
-    """Call LM Studio's OpenAI-compatible API."""
+    """
+    Call LM Studio's OpenAI-compatible API.
     
-    endpoint = f"{lm_studio_url}/chat/completions"
+    With on_chunk, the response is streamed (SSE) and each content delta is
+    passed to on_chunk as it arrives; the full text is still returned.
+    on_chunk may raise LMRequestCancelled to drop the request (returns None).
+    """
+    import http.client
     
-    payload = {
-        "messages": [
-            {"role": "user", "content": prompt}
-        ],
-        "temperature": 0.7,
-        "max_tokens": max_tokens,
-        "stream": False
-    }
+    client = _get_lm_client(lm_studio_url)
     
     try:
-        data = json.dumps(payload).encode('utf-8')
-        req = urllib.request.Request(
-            endpoint,
-            data=data,
-            headers={
-                'Content-Type': 'application/json'
-            }
-        )
+        if on_chunk is None:
+            return client.request_chat_completion(
+                prompt, max_tokens=max_tokens, temperature=0.7, timeout=300
+            )
         
-        with urllib.request.urlopen(req, timeout=300) as response:
-            result = json.loads(response.read().decode('utf-8'))
-            return result['choices'][0]['message']['content']
+        parts = []
+        for chunk in client.chat_completion_stream(
+            prompt, max_tokens=max_tokens, temperature=0.7, timeout=300
+        ):
+            parts.append(chunk)
+            on_chunk(chunk)
+        return ''.join(parts)
             
-    except urllib.error.URLError as e:
+    except LMRequestCancelled:
+        return None  # Closing the stream's socket stops generation server-side
+    except (OSError, http.client.HTTPException) as e:
         print(f"❌ LM Studio connection failed: {e}")
         print("   Make sure LM Studio is running with the local server enabled on port 1234")
         return None
@@ -264,67 +672,122 @@ def call_lm_studio(
 
 def check_lm_studio_connection(lm_studio_url: str = DEFAULT_LM_STUDIO_URL) -> bool:
     """Check if LM Studio server is running."""
-    try:
-        req = urllib.request.Request(f"{lm_studio_url}/models")
-        with urllib.request.urlopen(req, timeout=5) as response:
-            return response.status == 200
-    except:
-        return False
+    return _get_lm_client(lm_studio_url).check_connection()
 
 
 # ============================================================================
 # CONTENT GENERATION
 # ============================================================================
 
+_json_decoder = json.JSONDecoder()
+
+
+def _find_json_object(text: str) -> Optional[dict]:
+    """
+    Decode the first JSON object in a model response.
+    
+    Markdown fences or prose around the object are skipped without slicing
+    the response.
+    """
+    start = text.find("{")
+    while start != -1:
+        try:
+            obj, _ = _json_decoder.raw_decode(text, start)
+            return obj
+        except json.JSONDecodeError:
+            start = text.find("{", start + 1)
+    return None
+
+
 def extract_topics(transcription: str, lm_studio_url: str) -> Optional[dict]:
     """Extract topics from transcription using LM Studio."""
     print("🔍 Extracting topics...")
     
-    prompt = TOPIC_EXTRACTION_PROMPT.format(transcription=transcription)  # Process full text
+    prompt = _render_topic_prompt(transcription=transcription)  # Process full text
     response = call_lm_studio(prompt, lm_studio_url)
     
     if response:
-        try:
-            # Try to parse JSON from response
-            # Handle case where response might have markdown code blocks
-            clean_response = response.strip()
-            if clean_response.startswith("```"):
-                clean_response = clean_response.split("```")[1]
-                if clean_response.startswith("json"):
-                    clean_response = clean_response[4:]
-            
-            topics = json.loads(clean_response)
+        topics = _find_json_object(response)
+        if topics is not None:
             print(f"✅ Extracted {len(topics.get('topics', []))} topics")
             return topics
-        except json.JSONDecodeError:
-            # Return raw response if not valid JSON
-            return {"raw": response, "topics": [], "insights": [], "quotes": []}
+        # Return raw response if not valid JSON
+        return {"raw": response, "topics": [], "insights": [], "quotes": []}
     
     return None
 
 
-def generate_blog_post(transcription: str, topics: dict, lm_studio_url: str) -> Optional[str]:
-    """Generate blog post draft using LM Studio."""
+def generate_blog_post(
+    transcription: str,
+    topics: dict,
+    lm_studio_url: str,
+    output_file: Optional[Path] = None,
+    on_chunk: Optional[Callable[[str], None]] = None
+) -> Optional[str]:
+    """
+    Generate blog post draft using LM Studio.
+    
+    If output_file is given, the draft is streamed into "<output_file>.part"
+    as it's generated and renamed to output_file only once complete, so an
+    interrupted run never leaves a truncated draft under the final name.
+    on_chunk, if given, also receives each streamed piece of text.
+    """
     print("📝 Generating blog post...")
     
-    prompt = BLOG_GENERATION_PROMPT.format(
+    prompt = _render_blog_prompt(
         topics=", ".join(topics.get('topics', [])),
         insights="\n".join(f"- {i}" for i in topics.get('insights', [])),
         transcription=transcription  # Process full text
     )
     
-    response = call_lm_studio(prompt, lm_studio_url)
+    if output_file is None:
+        response = call_lm_studio(prompt, lm_studio_url, on_chunk=on_chunk)
+    else:
+        part_file = output_file.with_name(output_file.name + ".part")
+        try:
+            with open(part_file, 'w', encoding='utf-8') as f:
+                def write_chunk(chunk: str):
+                    f.write(chunk)
+                    if chunk.endswith('\n'):
+                        f.flush()  # Let the draft be followed line by line
+                    if on_chunk:
+                        on_chunk(chunk)
+                
+                response = call_lm_studio(prompt, lm_studio_url, on_chunk=write_chunk)
+            if response:
+                os.replace(part_file, output_file)
+        finally:
+            part_file.unlink(missing_ok=True)
+    
     if response:
         print("✅ Blog post generated")
     return response
 
 
-def generate_social_snippets(blog_content: str, lm_studio_url: str) -> Optional[str]:
-    """Generate social media snippets from blog content."""
+def generate_social_snippets(
+    blog_content: str,
+    lm_studio_url: str,
+    cancel: Optional[threading.Event] = None
+) -> Optional[str]:
+    """
+    Generate social media snippets from blog content.
+    
+    With cancel, the response is streamed and abandoned (returning None)
+    as soon as the event is set.
+    """
+    on_chunk = None
+    if cancel is not None:
+        if cancel.is_set():
+            return None
+        
+        def on_chunk(chunk: str):
+            if cancel.is_set():
+                raise LMRequestCancelled()
+    
     print("📱 Generating social snippets...")
     
-    prompt = SOCIAL_SNIPPETS_PROMPT.format(blog_content=blog_content[:4000])
-    response = call_lm_studio(prompt, lm_studio_url)
+    prompt = _render_snippets_prompt(blog_content=blog_content[:SNIPPET_SOURCE_CHARS])
+    response = call_lm_studio(prompt, lm_studio_url, on_chunk=on_chunk)
     if response:
         print("✅ Social snippets generated")
     return response
@@ -334,26 +797,125 @@ def generate_social_snippets(blog_content: str, lm_studio_url: str) -> Optional[
 # MAIN WORKFLOW
 # ============================================================================
 
+def needs_conversion(input_path: Path) -> bool:
+    """Whether the input has to be converted before whisper.cpp can read it."""
+    if input_path.suffix.lower() != '.wav':
+        return True  # Other audio or video: extract/convert to WAV
+    # Already 16kHz mono PCM (or can't probe): use it as-is
+    return get_cached_audio_params(input_path) not in (WHISPER_AUDIO_PARAMS, None)
+
+
+def prepare_audio(input_path: Path, work_dir: Path) -> Optional[Path]:
+    """Return a 16kHz mono WAV for the input, extracting one into work_dir if needed."""
+    if not needs_conversion(input_path):
+        return input_path
+    
+    audio_file = work_dir / "audio.wav"
+    if not extract_audio(str(input_path), str(audio_file)):
+        return None
+    return audio_file
+
+
+def transcribe_input(
+    input_path: Path,
+    work_dir: Path,
+    whisper_model: str,
+    language: str
+) -> Optional[str]:
+    """
+    Transcribe one recording into a transcript file in work_dir and return
+    its path. Inputs that need converting are streamed from ffmpeg into
+    whisper.cpp instead of via a temp WAV.
+    """
+    if needs_conversion(input_path):
+        return transcribe_media(
+            str(input_path), str(work_dir), model=whisper_model, language=language
+        )
+    return transcribe_audio(str(input_path), str(work_dir), model=whisper_model, language=language)
+
+
+# Written into each session dir: fingerprint of the recording it was made from
+SESSION_SOURCE_FILE = ".source"
+
+
+def find_session(input_path: Path, output_dir: str) -> Optional[Path]:
+    """Latest session dir in output_dir made from this exact recording."""
+    fingerprint = file_fingerprint(input_path)
+    prefix = f"{input_path.stem}_"
+    latest = None
+    try:
+        with os.scandir(output_dir) as entries:
+            for entry in entries:
+                if not entry.name.startswith(prefix) or not entry.is_dir():
+                    continue
+                try:
+                    with open(os.path.join(entry.path, SESSION_SOURCE_FILE), 'r', encoding='utf-8') as f:
+                        if f.read().strip() != fingerprint:
+                            continue
+                except OSError:
+                    continue
+                if latest is None or entry.name > latest.name:  # Names end in a timestamp
+                    latest = entry
+    except OSError:
+        return None
+    return Path(latest.path) if latest else None
+
+
+def is_session_complete(session_dir: Path, skip_lm: bool) -> bool:
+    """Whether a session already has everything this run would produce."""
+    if not (session_dir / "transcription.txt").is_file():
+        return False
+    return skip_lm or (session_dir / "blog_draft.md").is_file()
+
+
+def _write_json(path: Path, data: dict) -> None:
+    with open(path, 'w', encoding='utf-8') as f:
+        json.dump(data, f, ensure_ascii=False, indent=2)
+
+
 def run_workflow(
     input_file: str,
     output_dir: str = DEFAULT_OUTPUT_DIR,
     whisper_model: str = DEFAULT_WHISPER_MODEL,
     language: str = DEFAULT_LANGUAGE,
     lm_studio_url: str = DEFAULT_LM_STUDIO_URL,
-    skip_lm: bool = False
+    skip_lm: bool = False,
+    use_cache: bool = True,
+    resume: bool = False,
+    transcript_file: Optional[str] = None
 ) -> bool:
-    """Run the complete workflow."""
+    """
+    Run the complete workflow.
+    
+    With resume, a recording whose earlier session is complete is skipped,
+    and an incomplete one is finished in place. A transcript_file already
+    made for this recording (e.g. by a batch whisper.cpp run) is moved into
+    the session instead of looking in the cache or transcribing again.
+    """
+    
+    if not is_known_model(whisper_model):
+        _report_unknown_model(whisper_model)
+        return False
     
     input_path = Path(input_file)
     if not input_path.exists():
         print(f"❌ Input file not found: {input_file}")
         return False
     
-    # Create output directory
-    timestamp = datetime.now().strftime("%Y-%m-%d_%H-%M")
-    session_name = f"{input_path.stem}_{timestamp}"
-    session_dir = Path(output_dir) / session_name
-    session_dir.mkdir(parents=True, exist_ok=True)
+    session_dir = find_session(input_path, output_dir) if resume else None
+    if session_dir and is_session_complete(session_dir, skip_lm):
+        print(f"⏭️  Already processed, skipping: {input_file}")
+        print(f"   Output: {session_dir}")
+        return True
+    
+    if session_dir is None:
+        # Create output directory
+        timestamp = datetime.now().strftime("%Y-%m-%d_%H-%M")
+        session_name = f"{input_path.stem}_{timestamp}"
+        session_dir = Path(output_dir) / session_name
+        session_dir.mkdir(parents=True, exist_ok=True)
+        with open(session_dir / SESSION_SOURCE_FILE, 'w', encoding='utf-8') as f:
+            f.write(file_fingerprint(input_path))
     
     print(f"\n{'='*60}")
     print(f"🚀 ZOOM TO BLOG WORKFLOW")
@@ -362,36 +924,28 @@ def run_workflow(
     print(f"📂 Output: {session_dir}")
     print(f"{'='*60}\n")
     
-    # Step 1: Extract audio
-    audio_file = session_dir / "audio.wav"
-    if input_path.suffix.lower() in ['.wav']:
-        # Already WAV, just copy/link
-        audio_file = input_path
-    elif input_path.suffix.lower() in ['.mp3', '.m4a', '.ogg', '.flac']:
-        # Audio file, convert to WAV
-        if not extract_audio(str(input_path), str(audio_file)):
-            return False
+    cache_file = get_transcription_cache_path(input_path, whisper_model, language)
+    transcription_file = session_dir / "transcription.txt"
+    
+    # The transcript moves between whisper.cpp, the cache and the session as
+    # a file; it is only read into memory once LM Studio is going to use it.
+    if resume and _has_transcript(transcription_file):
+        print(f"♻️  Resuming with earlier transcription: "
+              f"{transcription_file.stat().st_size} bytes")
+    elif transcript_file and _move_transcript(transcript_file, transcription_file):
+        print("♻️  Using batch transcription")
+    elif use_cache and _copy_cached_transcription(cache_file, transcription_file):
+        print("♻️  Using cached transcription")
     else:
-        # Video file, extract audio
-        if not extract_audio(str(input_path), str(audio_file)):
+        # Steps 1-2: Extract audio and transcribe
+        transcript_file = transcribe_input(input_path, session_dir, whisper_model, language)
+        
+        if not transcript_file:
+            print("❌ Transcription failed")
             return False
-    
-    # Step 2: Transcribe
-    transcription = transcribe_audio(
-        str(audio_file),
-        str(session_dir),
-        model=whisper_model,
-        language=language
-    )
-    
-    if not transcription:
-        print("❌ Transcription failed")
-        return False
-    
-    # Save transcription
-    transcription_file = session_dir / "transcription.txt"
-    with open(transcription_file, 'w', encoding='utf-8') as f:
-        f.write(transcription)
+        
+        save_cached_transcription(cache_file, transcript_file)
+        os.replace(transcript_file, transcription_file)
     
     if skip_lm:
         print("\n✅ Workflow complete (LM Studio skipped)")
@@ -402,46 +956,220 @@ def run_workflow(
     print("\n🔌 Checking LM Studio connection...")
     if not check_lm_studio_connection(lm_studio_url):
         print("⚠️  LM Studio not available. Saving transcription only.")
-        print("   To process with AI, start LM Studio and run again with --continue flag")
+        print("   To process with AI, start LM Studio and run again with --resume")
         return True
     print("✅ LM Studio connected")
     
-    # Step 4: Extract topics
-    topics = extract_topics(transcription, lm_studio_url)
-    if topics:
-        topics_file = session_dir / "topics.json"
-        with open(topics_file, 'w', encoding='utf-8') as f:
-            json.dump(topics, f, ensure_ascii=False, indent=2)
-    else:
-        topics = {"topics": [], "insights": [], "quotes": []}
+    transcription = load_cached_transcription(transcription_file)
+    if not transcription:
+        print(f"❌ Could not read transcription: {transcription_file}")
+        return False
     
-    # Step 5: Generate blog post
-    blog_content = generate_blog_post(transcription, topics, lm_studio_url)
-    if blog_content:
-        blog_file = session_dir / "blog_draft.md"
-        with open(blog_file, 'w', encoding='utf-8') as f:
-            f.write(blog_content)
+    from concurrent.futures import ThreadPoolExecutor
     
-    # Step 6: Generate social snippets
-    if blog_content:
-        snippets = generate_social_snippets(blog_content, lm_studio_url)
-        if snippets:
-            snippets_file = session_dir / "social_snippets.txt"
-            with open(snippets_file, 'w', encoding='utf-8') as f:
-                f.write(snippets)
+    with ThreadPoolExecutor(max_workers=2) as pool:
+        # Step 4: Extract topics (saved in the background while the blog is written)
+        topics = extract_topics(transcription, lm_studio_url)
+        topics_saved = None
+        if topics:
+            topics_saved = pool.submit(_write_json, session_dir / "topics.json", topics)
+        else:
+            topics = {"topics": [], "insights": [], "quotes": []}
+        
+        # Step 5: Generate blog post. Snippets only need its beginning, so
+        # they are requested as soon as that much has streamed in (and
+        # cancelled if the blog post then fails).
+        blog_head: list[str] = []
+        head_chars = 0
+        snippets_future = None
+        cancel_snippets = threading.Event()
+        
+        def on_blog_chunk(chunk: str):
+            nonlocal head_chars, snippets_future
+            if snippets_future is not None:
+                return
+            blog_head.append(chunk)
+            head_chars += len(chunk)
+            if head_chars >= SNIPPET_SOURCE_CHARS:
+                snippets_future = pool.submit(
+                    generate_social_snippets, ''.join(blog_head), lm_studio_url,
+                    cancel_snippets
+                )
+        
+        blog_file = session_dir / "blog_draft.md"
+        blog_content = None
+        try:
+            blog_content = generate_blog_post(
+                transcription, topics, lm_studio_url,
+                output_file=blog_file, on_chunk=on_blog_chunk
+            )
+        finally:
+            if not blog_content and snippets_future is not None:
+                cancel_snippets.set()
+                snippets_future.cancel()
+        
+        # Step 6: Generate social snippets (already running for long posts)
+        if blog_content:
+            if snippets_future is None:
+                snippets_future = pool.submit(generate_social_snippets, blog_content, lm_studio_url)
+            snippets = snippets_future.result()
+            if snippets:
+                snippets_file = session_dir / "social_snippets.txt"
+                with open(snippets_file, 'w', encoding='utf-8') as f:
+                    f.write(snippets)
+        
+        if topics_saved is not None:
+            topics_saved.result()  # Surface any write error
     
     print(f"\n{'='*60}")
     print("✅ WORKFLOW COMPLETE!")
     print(f"{'='*60}")
     print(f"📂 Output directory: {session_dir}")
     print(f"\nGenerated files:")
-    for f in session_dir.iterdir():
-        print(f"  • {f.name}")
+    with os.scandir(session_dir) as entries:
+        for entry in entries:
+            if not entry.name.startswith('.'):
+                print(f"  • {entry.name}")
     print(f"{'='*60}\n")
     
     return True
 
 
+def run_batch_workflow(
+    input_files: list[str],
+    output_dir: str = DEFAULT_OUTPUT_DIR,
+    whisper_model: str = DEFAULT_WHISPER_MODEL,
+    language: str = DEFAULT_LANGUAGE,
+    lm_studio_url: str = DEFAULT_LM_STUDIO_URL,
+    skip_lm: bool = False,
+    use_cache: bool = True,
+    resume: bool = False
+) -> bool:
+    """
+    Run the workflow for several recordings.
+    
+    All recordings without a cached transcript are transcribed in one
+    whisper.cpp run (one model load). Each transcript is cached and handed
+    straight to its per-file workflow. A recording given
+    more than once (e.g. via different relative paths) is processed once.
+    With resume, recordings already completed in output_dir are skipped.
+    """
+    from concurrent.futures import ThreadPoolExecutor
+    
+    if not is_known_model(whisper_model):
+        _report_unknown_model(whisper_model)
+        return False
+    
+    # Dedupe on the resolved path but keep the first spelling the user gave
+    unique_files: dict[str, str] = {}
+    for input_file in input_files:
+        unique_files.setdefault(os.path.realpath(input_file), input_file)
+    input_files = list(unique_files.values())
+    pending: dict[str, tuple[str, Path]] = {}  # audio file -> (input, cache file)
+    # Inputs with a transcript: the file this run wrote, or None when a
+    # resumable session already holds it. Handed to the LM lane directly, so
+    # a failed cache write can't send a recording back through whisper.cpp.
+    ready: dict[str, Optional[str]] = {}
+    
+    skipped = 0
+    if resume:
+        remaining = []
+        for input_file in input_files:
+            input_path = Path(input_file)
+            session_dir = find_session(input_path, output_dir) if input_path.exists() else None
+            if session_dir and is_session_complete(session_dir, skip_lm):
+                print(f"⏭️  Already processed, skipping: {input_file}")
+                skipped += 1
+                continue
+            if session_dir and (session_dir / "transcription.txt").is_file():
+                ready[input_file] = None  # Only the LM stage is left
+            remaining.append(input_file)
+        input_files = remaining
+    
+    # Per-file workflows (LM Studio) run on their own worker, so whisper.cpp
+    # can transcribe the recordings the batch couldn't handle in the meantime
+    def submit(input_file: str, transcript_file: Optional[str] = None):
+        return lm_lane.submit(
+            run_workflow,
+            input_file,
+            output_dir=output_dir,
+            whisper_model=whisper_model,
+            language=language,
+            lm_studio_url=lm_studio_url,
+            skip_lm=skip_lm,
+            use_cache=True,
+            resume=resume,
+            transcript_file=transcript_file
+        )
+    
+    failed = 0
+    # Transcripts stay in work_root until the LM lane has moved them into place
+    with tempfile.TemporaryDirectory(prefix="zoom_to_blog_") as work_root:
+        jobs: list[tuple[str, Path, Path]] = []  # (input, cache file, work dir)
+        for i, input_file in enumerate(input_files):
+            input_path = Path(input_file)
+            if input_file in ready or not input_path.exists():
+                continue  # Missing inputs are reported by run_workflow below
+            
+            cache_file = get_transcription_cache_path(input_path, whisper_model, language)
+            if use_cache and cache_file.exists():
+                continue
+            
+            work_dir = Path(work_root) / str(i)
+            work_dir.mkdir()
+            jobs.append((input_file, cache_file, work_dir))
+        
+        # ffmpeg runs outside the GIL, so extractions overlap in threads
+        with ThreadPoolExecutor(max_workers=AUDIO_PREP_WORKERS) as pool:
+            audio_files = list(pool.map(
+                lambda job: prepare_audio(Path(job[0]), job[2]), jobs
+            ))
+        
+        for (input_file, cache_file, _), audio_file in zip(jobs, audio_files):
+            if audio_file:
+                pending[str(audio_file)] = (input_file, cache_file)
+        
+        if pending:
+            results = transcribe_audio_batch(list(pending), work_root, whisper_model, language)
+            for audio_file, transcript_file in results.items():
+                if transcript_file:
+                    input_file, cache_file = pending[audio_file]
+                    save_cached_transcription(cache_file, transcript_file)
+                    ready[input_file] = transcript_file
+        
+        with ThreadPoolExecutor(max_workers=1) as lm_lane:
+            workflows = []
+            retry: list[tuple[str, Path, Path]] = []  # (input, cache file, work dir)
+            for i, input_file in enumerate(input_files):
+                input_path = Path(input_file)
+                if input_file in ready or not input_path.exists():
+                    # Missing inputs get reported there
+                    workflows.append(submit(input_file, ready.get(input_file)))
+                    continue
+                cache_file = get_transcription_cache_path(input_path, whisper_model, language)
+                if use_cache and cache_file.exists():
+                    workflows.append(submit(input_file))
+                else:
+                    retry.append((input_file, cache_file, Path(work_root) / f"retry_{i}"))
+            
+            for input_file, cache_file, work_dir in retry:
+                work_dir.mkdir()
+                transcript_file = transcribe_input(Path(input_file), work_dir, whisper_model, language)
+                if not transcript_file:
+                    print(f"❌ Transcription failed: {input_file}")
+                    failed += 1
+                    continue
+                save_cached_transcription(cache_file, transcript_file)
+                workflows.append(submit(input_file, transcript_file))
+            
+            for workflow in workflows:
+                if not workflow.result():
+                    failed += 1
+    
+    print(f"📊 Batch: {len(input_files) - failed} processed, {skipped} skipped, {failed} failed")
+    return failed == 0
+
+
 # ============================================================================
 # CLI
 # ============================================================================
@@ -459,6 +1187,8 @@ Examples:
   %(prog)s recording.mp4 --whisper-model turbo
   %(prog)s recording.mp4 --language ru
   %(prog)s recording.mp4 --skip-lm  (transcription only)
+  %(prog)s part1.mp4 part2.mp4  (batch: model loaded once)
+  %(prog)s *.mp4 --resume  (retry a batch, skipping finished recordings)
 
 Available models: {', '.join(available_models)}
         """
@@ -466,13 +1196,14 @@ Available models: {', '.join(available_models)}
     
     parser.add_argument(
         "input",
-        help="Input video/audio file (mp4, m4a, mp3, wav, etc.)"
+        nargs="+",
+        help="Input video/audio file(s) (mp4, m4a, mp3, wav, etc.)"
     )
     parser.add_argument(
         "--whisper-model", "-m",
         default=DEFAULT_WHISPER_MODEL,
-        choices=available_models,
-        help=f"Whisper model (default: {DEFAULT_WHISPER_MODEL})"
+        help=f"Whisper model name or ggml model file (default: {DEFAULT_WHISPER_MODEL}; "
+             f"suggested: {', '.join(available_models)})"
     )
     parser.add_argument(
         "--language", "-l",
@@ -494,17 +1225,33 @@ Available models: {', '.join(available_models)}
         action="store_true",
         help="Skip LM Studio processing (transcription only)"
     )
+    parser.add_argument(
+        "--resume",
+        action="store_true",
+        help="Skip recordings already completed in the output directory "
+             "and finish partially processed ones"
+    )
+    parser.add_argument(
+        "--no-cache",
+        action="store_true",
+        help="Re-transcribe even if a cached transcription exists"
+    )
     
     args = parser.parse_args()
     
-    success = run_workflow(
-        input_file=args.input,
+    options = dict(
         output_dir=args.output_dir,
         whisper_model=args.whisper_model,
         language=args.language,
         lm_studio_url=args.lm_studio_url,
-        skip_lm=args.skip_lm
+        skip_lm=args.skip_lm,
+        use_cache=not args.no_cache,
+        resume=args.resume
     )
+    if len(args.input) > 1:
+        success = run_batch_workflow(args.input, **options)
+    else:
+        success = run_workflow(input_file=args.input[0], **options)
     
     sys.exit(0 if success else 1)
 